@@ -0,0 +1,186 @@
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+PROGRAM_DIR = Path(__file__).resolve().parent
+
+# JVM launch profiles (environment read by shared/r_base.sh); CDS profiles
+# require the archive, so an unusable one fails the row instead of silently
+# measuring a launch without it
+PROFILES = {
+	"default":     {"PREDICATE_JVM_CDS": "0",       "PREDICATE_JVM_STARTUP": "0"},
+	"cds":         {"PREDICATE_JVM_CDS": "require", "PREDICATE_JVM_STARTUP": "0"},
+	"cds+startup": {"PREDICATE_JVM_CDS": "require", "PREDICATE_JVM_STARTUP": "1"},
+}
+
+
+def measure(case_dir:Path, calls:int, good_port:str, ramdisk:bool=False) -> Dict[str, float]:
+	"""
+	Time repeated predicate calls on the case input (run under basexserver_wrapper).
+	Every call must reproduce: a failed launch would otherwise be timed as a fast one.
+	"""
+
+	sys.path.insert(0, str(PROGRAM_DIR.parents[1] / "src"))
+
+	from utils.oracle import build_oracle
+	from utils.ramdisk import RamDir
+
+	ramdir   = None
+	run_base = case_dir
+
+	# launch from a RAM-disk copy like minimize_xml --ramdisk (relocated, staged jars)
+	if ramdisk:
+		ramdir = RamDir("benchjvm")
+
+		run_base = ramdir.predicate_copy(case_dir)
+
+	xml_path = run_base / "input.xml"
+	original = xml_path.read_text(encoding="utf-8")
+
+	oracle = build_oracle(base=run_base, input_name="input.xml", script_name="r.sh", good_port=good_port)
+
+	latencies: List[float] = []
+
+	try:
+		for i in range(calls):
+			start = time.perf_counter()
+			interesting, _ = oracle(original)
+			latencies.append(time.perf_counter() - start)
+
+			if not interesting: raise RuntimeError(f"predicate did not reproduce on {case_dir.name}/input.xml (call {i + 1})")
+
+	finally: 
+		xml_path.write_text(original, encoding="utf-8")
+
+		if ramdir is not None: ramdir.clean()
+
+	return {
+		"calls":          calls,
+		"mean_seconds":   statistics.mean(latencies),
+		"median_seconds": statistics.median(latencies),
+		"min_seconds":    min(latencies),
+	}
+
+
+def run_one(case_dir:Path, profile:str, calls:int, ramdisk:bool=False) -> Dict[str, object]:
+	"""Measure one case under one JVM profile via the BaseX server wrapper."""
+
+	scripts_dir = PROGRAM_DIR.parents[1] / "scripts"
+
+	cmd = [str(scripts_dir / "basexserver_wrapper"), "--"]
+	cmd += [sys.executable, str(Path(__file__).resolve()), "--measure", str(case_dir), "--calls", str(calls)]
+
+	if ramdisk: cmd += ["--ramdisk"]
+
+	env = os.environ.copy()
+	env.update(PROFILES[profile])
+
+	proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
+
+	row: Dict[str, object] = {"predicate": case_dir.name, "profile": profile, "ramdisk": ramdisk, "return_code": proc.returncode}
+
+	if proc.returncode != 0:
+		# fatal predicate errors (e.g. unusable required archive) are reported on stdout
+		output = proc.stderr.strip() or proc.stdout.strip()
+
+		row["error"] = output.splitlines()[-1] if output else f"rc={proc.returncode}"
+		return row
+
+	row.update(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+	return row
+
+
+def main():
+	p = argparse.ArgumentParser(description="Benchmark: per-call predicate latency under JVM launch profiles (see scripts/jvm_cds)")
+
+	p.add_argument(
+		"--pred-root",
+		default=str(PROGRAM_DIR.parents[1] / "predicates" / "xmlprocessor"),
+		help="Path to predicates/xmlprocessor root"
+	)
+
+	p.add_argument(
+		"--cases",
+		default="xml-1e9bc83-",
+		help="Case directory name prefix (default: xml-1e9bc83-)"
+	)
+
+	p.add_argument(
+		"--calls",
+		type=int,
+		default=10,
+		help="Predicate calls per case and profile (default: 10)"
+	)
+
+	p.add_argument(
+		"--output",
+		default=str(PROGRAM_DIR.parent / "results" / "jvm.csv"),
+		help="Output CSV path"
+	)
+
+	p.add_argument(
+		"--ramdisk",
+		action="store_true",
+		help="Launch predicates from a RAM-disk copy with staged jars (as minimize_xml --ramdisk)"
+	)
+
+	# internal: single measurement under basexserver_wrapper
+	p.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+	p.add_argument("--good-port", default=os.environ.get("BASEX_GOOD_PORT", "1984"), help=argparse.SUPPRESS)
+
+	args = p.parse_args()
+
+	if args.measure:
+		print(json.dumps(measure(args.measure.resolve(), args.calls, args.good_port, args.ramdisk)))
+		return
+
+	pred_root = Path(args.pred_root).resolve()
+	out_csv   = Path(args.output)
+	out_csv.parent.mkdir(parents=True, exist_ok=True)
+
+	cases = sorted(c for c in pred_root.iterdir() if c.is_dir() and c.name.startswith(args.cases))
+
+	if not (pred_root / "lib" / "cds").is_dir():
+		print("Warning: no AppCDS archives found; run scripts/jvm_cds first", file=sys.stderr)
+
+	rows = []
+
+	for case_dir in cases:
+		for profile in PROFILES:
+			row = run_one(case_dir, profile, args.calls, args.ramdisk)
+			rows.append(row)
+
+			print(f"{case_dir.name}\t{profile:<12}\t{row.get('mean_seconds', row.get('error'))}")
+
+	# per-call latency change relative to the default launch profile
+	baseline = {r["predicate"]: r["mean_seconds"] for r in rows if r["profile"] == "default" and "mean_seconds" in r}
+
+	for row in rows:
+		if "mean_seconds" in row and row["predicate"] in baseline:
+			row["delta_vs_default_seconds"] = row["mean_seconds"] - baseline[row["predicate"]]
+
+	# build fieldnames in deterministic order: first by first appearance across rows
+	fieldnames = []
+
+	for row in rows:
+		for k in row.keys():
+			if k not in fieldnames: fieldnames.append(k)
+
+	with out_csv.open("w", newline="", encoding="utf-8") as f:
+		writer = csv.DictWriter(f, fieldnames=fieldnames)
+
+		writer.writeheader()
+		writer.writerows(rows)
+
+
+if __name__ == "__main__":
+	main()
@@ -1,6 +1,7 @@
 import argparse
 import csv
 import hashlib
+import json
 import os
 import re
 import subprocess
@@ -48,11 +49,34 @@ def parse_minimize_stdout(stdout:str) -> Tuple[Optional[int], Optional[int]]:
 		if oracle_calls is None and (match := RE_ORA_CALLS.search(line)): oracle_calls = int(match.group(1))
 		if min_len is not None and oracle_calls is not None: break
 
-	if not all(min_len, oracle_calls): raise RuntimeError("Malformed output - could not parse minimized length / oracle calls")
+	if min_len is None or oracle_calls is None: raise RuntimeError("Malformed output - could not parse minimized length / oracle calls")
 
 	return min_len, oracle_calls
 
 
+def parse_store_stdout(stdout:str) -> Dict[str, object]:
+	"""
+	Parse minimize_xml stdout (with --store / --infer) for:
+
+	- Replayed verdicts: <count>
+	- Live verdicts: <count>
+	- Inferred verdicts: <count>
+	- Executed verdicts: <count>
+	- Replayed predicate time: <seconds>s
+	"""
+
+	RE_STORE = re.compile(r"^\s*-\s*(Replayed|Live|Inferred|Executed) verdicts:\s*(\d+)\s*$")
+	RE_SIM   = re.compile(r"^\s*-\s*Replayed predicate time:\s*([0-9.]+)s\s*$")
+
+	counts: Dict[str, object] = {}
+
+	for line in stdout.splitlines():
+		if match := RE_STORE.search(line): counts[f"{match.group(1).lower()}_verdicts"] = int(match.group(2))
+		if match := RE_SIM.search(line): counts["replayed_predicate_seconds"] = float(match.group(1))
+
+	return counts
+
+
 def parse_perf_stat_csv(path:Path) -> Dict[str, float]:
 	"""Parse perf stat CSV and return a dict of normalized keys to numeric values."""
 
@@ -84,12 +108,53 @@ def parse_perf_stat_csv(path:Path) -> Dict[str, float]:
 	return metrics
 
 
+def verify_one(
+	case_dir:Path,
+	min_out:Path,
+	unit:str,
+	workers:Optional[str]=None) -> Dict[str, object]:
+
+	"""
+	Run the 1-minimality verifier on a minimized output and gather its verdict
+	(all counterexamples: missed_bytes must not depend on where probing stopped).
+	"""
+
+	scripts_dir = PROGRAM_DIR.parents[1] / "scripts"
+	report_out  = min_out.with_suffix(min_out.suffix + ".minimality.json")
+
+	cmd = [] if workers else [str(scripts_dir / "basexserver_wrapper"), "--"]
+	cmd += [str(scripts_dir / "verify_minimal"), str(case_dir), str(min_out), "--unit", unit, "--all", "--report", str(report_out)]
+
+	if workers: cmd += ["--workers", workers]
+
+	# drop a previous campaign's report: only this run's may be attached to the row
+	report_out.unlink(missing_ok=True)
+
+	proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+	# 0 minimal, 1 not minimal; anything else (fatal predicate error, not reproducing) has no verdict
+	if proc.returncode not in (0, 1): return {"minimal": "", "minimality_error": f"rc={proc.returncode}"}
+
+	try: report = json.loads(report_out.read_text(encoding="utf-8"))
+	except Exception: return {"minimal": "", "minimality_error": "no report"}
+
+	return {
+		"minimal":           report["minimal"],
+		"minimality_probes": report["probes"],
+		"removable_units":   len(report["counterexamples"]),
+		"missed_bytes":      report["missed_bytes"],
+	}
+
+
 def run_one(
 	case_dir:Path, 
 	rel_input:Path, 
-	module:str) -> Dict[str, object]:
+	module:str,
+	workers:Optional[str]=None,
+	minimize_args:Optional[List[str]]=None,
+	verify:Optional[str]=None) -> Dict[str, object]:
 	
-	"""Run one minimization via perf + wrapper and gather metrics."""
+	"""Run one minimization via perf + wrapper (or remote workers) and gather metrics."""
 	
 	# prepare perf file path unique per run
 	perf_dir = PROGRAM_DIR.parent / "results" / "perf"
@@ -111,7 +176,8 @@ def run_one(
 	# build command
 	scripts_dir = PROGRAM_DIR.parents[1] / "scripts"
 
-	cmd = [str(scripts_dir / "basexserver_wrapper"), "--verbose", "--"]
+	# remote workers host their own BaseX servers: no local wrapper needed
+	cmd = [] if workers else [str(scripts_dir / "basexserver_wrapper"), "--verbose", "--"]
 	cmd += ["perf", "stat", "-x", ",", "-o", str(perf_out)]
 	cmd += [
 		str(scripts_dir / "minimize_xml"),
@@ -123,6 +189,9 @@ def run_one(
 		"--output", str(min_out)
 	]
 
+	if workers: cmd += ["--workers", workers]
+	if minimize_args: cmd += minimize_args
+
 	# stable number formatting for perf output
 	env = os.environ.copy()
 	env.setdefault("LC_ALL", "C")
@@ -200,6 +269,12 @@ def run_one(
 		"reduction_ratio":    reduction_ratio,
 	}
 
+	# record/replay and inference counters (with --store / --infer)
+	row.update(parse_store_stdout(stdout))
+
+	# optional 1-minimality verdict of the output
+	if verify and retcode == 0: row.update(verify_one(case_dir, min_out, verify, workers))
+
 	# merge perf metrics (prefix with "perf_")
 	for k, v in perf.items():
 		row[f"perf_{k}"] = v
@@ -242,8 +317,56 @@ def main():
 		help=f"Number of parallel runs (default: {default_jobs})"
 	)
 
+	p.add_argument(
+		"--workers",
+		default=None,
+		help="Comma-separated host:port oracle workers (see scripts/oracle_worker) to evaluate candidates on"
+	)
+
+	p.add_argument(
+		"--store",
+		default=None,
+		help="Shared verdict store recording every oracle call across runs and algorithms"
+	)
+
+	p.add_argument(
+		"--replay",
+		action="store_true",
+		help="With --store: answer recorded candidates from the store (only unseen ones run the predicate)"
+	)
+
+	p.add_argument(
+		"--replay-latency",
+		type=float,
+		default=0.0,
+		help="Scale of the slept recorded latency on replay (default: 0, not slept; recorded time is reported as replayed_predicate_seconds)"
+	)
+
+	p.add_argument(
+		"--verify",
+		choices=("char", "token"),
+		default=None,
+		help="Check each output for 1-minimality with scripts/verify_minimal at this unit granularity"
+	)
+
+	p.add_argument(
+		"--infer",
+		choices=("exact", "monotone"),
+		default=None,
+		help="Verdict inference in minimize_xml: exact repeats only, or assuming a monotone predicate"
+	)
+
 	args = p.parse_args()
 
+	if args.replay and not args.store: p.error("--replay requires --store")
+
+	# forwarded minimize_xml options
+	minimize_args = []
+
+	if args.store: minimize_args += ["--store", str(Path(args.store).resolve()), "--replay-latency", str(args.replay_latency)]
+	if args.replay: minimize_args += ["--replay"]
+	if args.infer: minimize_args += ["--infer"] + (["--assume-monotone"] if args.infer == "monotone" else [])
+
 	pred_root = Path(args.pred_root).resolve()
 	out_csv   = Path(args.output)
 	out_csv.parent.mkdir(parents=True, exist_ok=True)
@@ -263,6 +386,10 @@ Command: basexserver_wrapper --verbose -- perf stat -x , -o <path> minimize_xml
 
 Benchmark Parameters:
  - Max. concurrent runs: {args.jobs}
+ - Oracle workers: {args.workers or "local"}
+ - Verdict store: {args.store or "none"}{" (replay)" if args.replay else ""}
+ - Minimality check: {args.verify or "off"}
+ - Verdict inference: {args.infer or "off"}
  
 Test Cases: {"".join([f"\n - {case}" for case in cases])}
 
@@ -296,7 +423,7 @@ See output parent dir for artefacts.
 	
 	if args.jobs <= 1:
 		for i, (case_dir, rel_input, module) in enumerate(tasks):
-			rows[i] = run_one(case_dir, rel_input, module)
+			rows[i] = run_one(case_dir, rel_input, module, args.workers, minimize_args, args.verify)
 
 	else:
 		with ThreadPoolExecutor(max_workers=args.jobs) as ex:
@@ -305,7 +432,7 @@ See output parent dir for artefacts.
 			for i, (case_dir, rel_input, module) in enumerate(tasks):
 				print(f"[{datetime.datetime.now().strftime("%H:%M:%S")}] (start | id:{i}) {module}\t...\t{case_dir.name}/{rel_input}")
 				
-				fut = ex.submit(run_one, case_dir, rel_input, module)
+				fut = ex.submit(run_one, case_dir, rel_input, module, args.workers, minimize_args, args.verify)
 				futures[fut] = i
 				
 				# delay to account for BaseXServer startup
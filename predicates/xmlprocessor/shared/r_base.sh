@@ -1,7 +1,8 @@
 #!/bin/bash
 
 SCRIPT_DIR=$1
-LIB_DIR="${SCRIPT_DIR}/../lib"
+# canonical path: AppCDS archives record the classpath they were dumped with (scripts/jvm_cds)
+LIB_DIR="$(cd -- "${SCRIPT_DIR}/../lib" >/dev/null 2>&1 && pwd -P)" || LIB_DIR="${SCRIPT_DIR}/../lib"
 
 HOST=127.0.0.1
 BASEX_GOOD_PORT=$2
@@ -9,12 +10,48 @@ BASEX_BAD_PORT=$((BASEX_GOOD_PORT + 1))
 
 INPUT_NAME=${3:-input.xml}
 
+# JVM launch options: AppCDS archive of the jar set (see scripts/jvm_cds)
+# unless PREDICATE_JVM_CDS=0 (=require: fail if the archive is unusable
+# instead of silently running without it), startup-oriented flags if
+# PREDICATE_JVM_STARTUP=1
+jvm_opts() {
+	local archive="${LIB_DIR}/cds/$1.jsa"
+
+	if [[ "${PREDICATE_JVM_CDS:-1}" == "require" ]]; then
+		printf '%s\n' "-XX:SharedArchiveFile=$archive" "-Xshare:on"
+	elif [[ "${PREDICATE_JVM_CDS:-1}" != "0" && -f "$archive" ]]; then
+		printf '%s\n' "-XX:SharedArchiveFile=$archive" "-Xshare:auto"
+	fi
+
+	if [[ "${PREDICATE_JVM_STARTUP:-0}" == "1" ]]; then
+		printf '%s\n' "-XX:TieredStopAtLevel=1" "-XX:+UseSerialGC" "-XX:-UsePerfData"
+	fi
+}
+
+# archive required but unusable (missing or rejected by the JVM): fatal, not a verdict
+cds_failed() {
+	[[ "${PREDICATE_JVM_CDS:-1}" == "require" ]] && grep -qi "shared archive" "$1"
+}
+
+require_cds() {
+	if cds_failed "$1"; then
+		echo "Error: AppCDS archive unusable with PREDICATE_JVM_CDS=require (see $1)" >&2
+		exit 5
+	fi
+}
+
+mapfile -t SAXON_OPTS < <(jvm_opts "saxon-12.4")
+mapfile -t BASEX_BAD_OPTS < <(jvm_opts "basex-${BAD_VERSION}")
+mapfile -t BASEX_GOOD_OPTS < <(jvm_opts "basex-${GOOD_VERSION}")
+
 # run saxon
 target_saxon="saxon"
-java -cp "${LIB_DIR}/saxon-he-12.4.jar:${LIB_DIR}/xmlresolver-5.2.0/lib/*" net.sf.saxon.Query -s:"$SCRIPT_DIR/$INPUT_NAME" -q:"$SCRIPT_DIR/query.xq" > ${target_saxon}_raw_result.xml 2>&1
+java "${SAXON_OPTS[@]}" -cp "${LIB_DIR}/saxon-he-12.4.jar:${LIB_DIR}/xmlresolver-5.2.0/lib/*" net.sf.saxon.Query -s:"$SCRIPT_DIR/$INPUT_NAME" -q:"$SCRIPT_DIR/query.xq" > ${target_saxon}_raw_result.xml 2>&1
 ret=$?
 	
 if [ $ret != 0 ]; then
+	require_cds ${target_saxon}_raw_result.xml
+
 	exit 1
 fi
 
@@ -28,10 +65,12 @@ check_listening() {
 
 # run basex_bad
 target_basex_bad="basex_bad"
-java -cp "${LIB_DIR}/basex-${BAD_VERSION}.jar" org.basex.BaseXClient -n "$HOST" -p "$BASEX_BAD_PORT" -U admin -P password -i "$SCRIPT_DIR/$INPUT_NAME" "$SCRIPT_DIR/query.xq" > ${target_basex_bad}_raw_result.xml 2>&1
+java "${BASEX_BAD_OPTS[@]}" -cp "${LIB_DIR}/basex-${BAD_VERSION}.jar" org.basex.BaseXClient -n "$HOST" -p "$BASEX_BAD_PORT" -U admin -P password -i "$SCRIPT_DIR/$INPUT_NAME" "$SCRIPT_DIR/query.xq" > ${target_basex_bad}_raw_result.xml 2>&1
 ret=$?
 
 if [ $ret != 0 ]; then
+	require_cds ${target_basex_bad}_raw_result.xml
+
 	if ! check_listening "$HOST" "$BASEX_BAD_PORT"; then
 		echo "Error: BaseX bad server not reachable on $HOST:$BASEX_BAD_PORT" >&2
 		exit 3
@@ -45,10 +84,12 @@ fi
 
 # run basex_good
 target_basex_good="basex_good"
-java -cp "${LIB_DIR}/basex-${GOOD_VERSION}.jar" org.basex.BaseXClient -n "$HOST" -p "$BASEX_GOOD_PORT" -U admin -P password -i "$SCRIPT_DIR/$INPUT_NAME" "$SCRIPT_DIR/query.xq" > ${target_basex_good}_raw_result.xml 2>&1
+java "${BASEX_GOOD_OPTS[@]}" -cp "${LIB_DIR}/basex-${GOOD_VERSION}.jar" org.basex.BaseXClient -n "$HOST" -p "$BASEX_GOOD_PORT" -U admin -P password -i "$SCRIPT_DIR/$INPUT_NAME" "$SCRIPT_DIR/query.xq" > ${target_basex_good}_raw_result.xml 2>&1
 ret=$?
 
 if [ $ret != 0 ]; then
+	require_cds ${target_basex_good}_raw_result.xml
+
 	if ! check_listening "$HOST" "$BASEX_GOOD_PORT"; then
 		echo "Error: BaseX good server not reachable on $HOST:$BASEX_GOOD_PORT" >&2
 		exit 3
@@ -1,22 +1,25 @@
-from typing import Callable
+from typing import Callable, Optional
 from math import ceil
 from datetime import datetime
 
+from dd.warmstart import warm_start
+from dd.infer import VerdictIndex
 
-def complement_sweep(target:str, partlen:int, oracle:Callable) -> str:
+
+def complement_sweep(target:str|list[int], partlen:int, oracle:Callable) -> tuple[str|list[int], int]:
 	"""
 	Identify benign chunks of target with variable granularity.
 
-	:param target: input string.
+	:param target: input string (or retained positions, see `VerdictIndex.bind`).
 	:param partlen: partition length.
 	:param oracle: oracle function.
-	:returns: reduced string.
+	:returns: reduced target and no. of well-formed oracle calls.
 	"""
 
 	# count no. of oracle calls that pass XML well-formedness pre-check
 	n_good_oracalls = 0
 
-	reduced = ""
+	reduced = target[:0]
 	
 	# test contiguous discrete chunks of size partlen for interestingness
 	for i in range(0, len(target), partlen):
@@ -37,7 +40,9 @@ def minimize(
 	target:str, 
 	oracle:Callable, 
 	stats:bool  =False, 
-	verbose:bool=False) -> tuple[str, int, int] | str:
+	verbose:bool=False,
+	prior:Optional[tuple[str, str]]=None,
+	index:Optional[VerdictIndex]   =None) -> tuple[str, int, int] | str:
 	
 	"""
 	Classical Delta-Debugging algorithm.
@@ -46,6 +51,8 @@ def minimize(
 	:param oracle: oracle function.
 	:param stats: data collection flag.
 	:param verbose: verbose output flag.
+	:param prior: previous (original, minimized) pair to warm-start from.
+	:param index: verdict index to answer repeated/implied configurations from.
 	:returns: reduced string and optional stats.
 	"""
 
@@ -56,6 +63,22 @@ def minimize(
 	# partition size
 	partlen = len(target) // 2
 
+	# warm start: propose previous result mapped onto target, seed granularity
+	if prior is not None:
+		target, partlen, n_seed_total_oracalls, n_seed_good_oracalls = warm_start(target, prior, oracle)
+
+		if stats:
+			n_total_oracalls += n_seed_total_oracalls
+			n_good_oracalls  += n_seed_good_oracalls
+
+	# verdict inference: minimize retained positions, materialize candidates on demand
+	if index is not None:
+		source          = target
+		n_inferred      = index.n_inferred
+		n_inferred_good = index.n_inferred_good
+		target          = list(range(len(source)))
+		oracle          = index.bind(oracle, source)
+
 	while partlen and target:
 		if verbose: print(f"[{datetime.now().strftime("%H:%M:%S")}] {len(target):.2E}\t...\t{partlen}")
 
@@ -69,5 +92,13 @@ def minimize(
 		if reduced == target: partlen //= 2		
 		
 		target = reduced
+
+	if index is not None:
+		target = "".join(source[p] for p in target)
+
+		# count executed oracle calls only
+		if stats:
+			n_total_oracalls -= index.n_inferred - n_inferred
+			n_good_oracalls  -= index.n_inferred_good - n_inferred_good
 	
 	return (target, n_total_oracalls, n_good_oracalls) if stats else target
@@ -0,0 +1,129 @@
+from typing import Callable, Optional
+
+
+def spans(retained:list[int]) -> list[tuple[int, int]]:
+	"""Compress sorted retained positions to [start, end) spans."""
+
+	out = []
+
+	for p in retained:
+		if out and out[-1][1] == p: out[-1] = (out[-1][0], p + 1)
+		else: out.append((p, p + 1))
+
+	return out
+
+
+def bitmask(config:list[tuple[int, int]]) -> int:
+	"""Encode retained spans as a position bitmask (subset test: a & ~b == 0)."""
+
+	mask = 0
+
+	for start, end in config:
+		mask |= ((1 << (end - start)) - 1) << start
+
+	return mask
+
+
+class VerdictIndex():
+	"""
+	Verdicts of tested configurations (sets of retained spans over the input
+	minimization starts from).
+
+	Exact repeats are always answered from the index. With monotone, a
+	configuration is also inferred uninteresting if it is a subset of a
+	known uninteresting one, and interesting if it is a superset of a known
+	interesting one. Known sets are bucketed by size and kept as antichains
+	(maximal uninteresting, minimal interesting), so a lookup only scans
+	buckets that can contain a sub-/superset.
+	"""
+
+	def __init__(self, monotone:bool=False):
+		self.monotone = monotone
+
+		self.verdicts      = {}  # mask -> (interesting, well formed)
+		self.interesting   = {}  # size -> minimal interesting masks
+		self.uninteresting = {}  # size -> maximal uninteresting masks
+
+		self.n_executed      = 0
+		self.n_inferred      = 0
+		self.n_inferred_good = 0  # inferred verdicts reported well formed
+
+
+	def infer(self, mask:int, size:int) -> Optional[tuple[bool, bool]]:
+		"""
+		Look up the (implied) verdict of a configuration.
+
+		:param mask: configuration bitmask.
+		:param size: no. of retained positions.
+		:returns: tuple of (is interesting, is well formed) or None if
+			unknown; exact repeats report the recorded pair, implied verdicts
+			(only generalized from well-formed ones) report well formed.
+		"""
+
+		if mask in self.verdicts: return self.verdicts[mask]
+
+		if not self.monotone: return None
+
+		# subset of a known uninteresting configuration
+		for n, masks in self.uninteresting.items():
+			if n >= size and any(mask & ~u == 0 for u in masks): return False, True
+
+		# superset of a known interesting configuration
+		for n, masks in self.interesting.items():
+			if n <= size and any(i & ~mask == 0 for i in masks): return True, True
+
+		return None
+
+
+	def add(self, mask:int, size:int, interesting:bool, well_formed:bool) -> None:
+		"""Record an executed verdict."""
+
+		self.verdicts[mask] = (interesting, well_formed)
+
+		# pre-check rejections (malformed) say nothing about the predicate
+		if not (self.monotone and well_formed): return
+
+		if interesting:
+			# drop supersets: implied by the new minimal element
+			for n in [n for n in self.interesting if n >= size]:
+				self.interesting[n] = [i for i in self.interesting[n] if mask & ~i != 0]
+
+			self.interesting.setdefault(size, []).append(mask)
+
+		else:
+			# drop subsets: implied by the new maximal element
+			for n in [n for n in self.uninteresting if n <= size]:
+				self.uninteresting[n] = [u for u in self.uninteresting[n] if u & ~mask != 0]
+
+			self.uninteresting.setdefault(size, []).append(mask)
+
+
+	def bind(self, oracle:Callable, source:str) -> Callable:
+		"""
+		Oracle over configurations given as retained positions of source:
+		answered from the index if implied, else the candidate is
+		materialized, the oracle invoked and the verdict recorded.
+
+		:param oracle: oracle function.
+		:param source: input string minimization starts from.
+		:returns: oracle function over sorted position lists (inferred
+			calls counted in `n_inferred` / `n_inferred_good`).
+		"""
+
+		def query(retained:list[int]) -> tuple[bool, bool]:
+			mask    = bitmask(spans(retained))
+			implied = self.infer(mask, len(retained))
+
+			if implied is not None:
+				self.n_inferred      += 1
+				self.n_inferred_good += implied[1]
+				return implied
+
+			interesting, well_formed = oracle("".join(source[p] for p in retained))
+
+			self.n_executed += 1
+			self.add(mask, len(retained), interesting, well_formed)
+
+			return interesting, well_formed
+
+		return query
@@ -0,0 +1,103 @@
+from typing import Callable
+import re
+
+
+# token units: tags, entity/char references, words, whitespace runs, any other char
+RE_TOKEN = re.compile(r"<[^<>]*>|&[^&;\s]*;|\w+|\s+|.", re.DOTALL)
+
+
+def units(target:str, granularity:str="char") -> list[tuple[int, int]]:
+	"""
+	Split target into removal units.
+
+	:param target: input string.
+	:param granularity: "char" or "token".
+	:returns: list of [start, end) unit spans.
+	"""
+
+	if granularity == "char": return [(i, i + 1) for i in range(len(target))]
+	if granularity == "token": return [m.span() for m in RE_TOKEN.finditer(target)]
+
+	raise ValueError(f"Unknown unit granularity: {granularity}")
+
+
+def missed_bytes(target:str, counterexamples:list[dict]) -> int:
+	"""
+	UTF-8 size of the largest removable single unit among the found
+	counterexamples: a lower bound on the missed reduction, and only over
+	the first counterexample wave unless all units were probed.
+	"""
+
+	return max((len(target[c["start"]:c["end"]].encode("utf-8")) for c in counterexamples), default=0)
+
+
+def verify_minimal(
+	target:str,
+	evaluate:Callable,
+	granularity:str="char",
+	find_all:bool  =False,
+	wave:int       =8) -> dict:
+
+	"""
+	Check 1-minimality: no single unit can be removed while staying interesting.
+
+	The target itself is evaluated first: if it does not reproduce, the
+	check is meaningless and no probes are run ("minimal" is None). Probes
+	are evaluated in waves of parallel candidates; unless find_all, stops
+	after the first wave containing a counterexample.
+
+	:param target: (minimized) input string.
+	:param evaluate: batch oracle, list of candidates -> list of (is interesting, is well formed).
+	:param granularity: removal unit ("char" or "token").
+	:param find_all: collect all counterexamples instead of stopping early.
+	:param wave: candidates per batch.
+	:returns: report dict.
+	"""
+
+	spans = units(target, granularity)
+
+	# 1-minimality is only defined for an input that still reproduces
+	reproduces, _ = evaluate([target])[0]
+
+	if not reproduces:
+		return {
+			"length":          len(target),
+			"granularity":     granularity,
+			"units":           len(spans),
+			"reproduces":      False,
+			"probes":          0,
+			"good_probes":     0,
+			"minimal":         None,
+			"complete":        False,
+			"missed_bytes":    0,
+			"counterexamples": [],
+		}
+
+	n_probes        = 0
+	n_good_oracalls = 0
+	counterexamples = []
+
+	for w in range(0, len(spans), wave):
+		batch   = spans[w:w + wave]
+		results = evaluate([target[:start] + target[end:] for start, end in batch])
+
+		n_probes += len(batch)
+
+		for (start, end), (interesting, well_formed) in zip(batch, results):
+			if well_formed: n_good_oracalls += 1
+			if interesting: counterexamples.append({"start": start, "end": end, "unit": target[start:end]})
+
+		if counterexamples and not find_all: break
+
+	return {
+		"length":          len(target),
+		"granularity":     granularity,
+		"units":           len(spans),
+		"reproduces":      True,
+		"probes":          n_probes,
+		"good_probes":     n_good_oracalls,
+		"minimal":         not counterexamples,
+		"complete":        find_all or not counterexamples,
+		"missed_bytes":    missed_bytes(target, counterexamples),
+		"counterexamples": counterexamples,
+	}
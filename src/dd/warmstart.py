@@ -0,0 +1,204 @@
+from typing import Callable
+from difflib import SequenceMatcher
+import re
+
+
+def runs(mask:list[bool]) -> list[tuple[int, int]]:
+	"""Maximal [start, end) runs of set positions in mask."""
+
+	out   = []
+	start = None
+
+	for i, bit in enumerate(mask + [False]):
+		if bit and start is None: start = i
+
+		if not bit and start is not None:
+			out.append((start, i))
+			start = None
+
+	return out
+
+
+# (optimization) character-level matching is quadratic: diff coarse units
+# first (lines, then tags for single-line XML) and refine changed hunks at
+# character level only up to this many (old x new) characters
+REFINE_LIMIT = 1 << 22
+
+SPLITTERS = (
+	lambda s: s.splitlines(keepends=True),
+	lambda s: re.findall(r"[^>]*>|[^>]+", s)
+)
+
+
+def embed(original:str, minimized:str) -> list[bool]:
+	"""
+	Greedy left-to-right embedding of minimized into original.
+
+	:param original: previous original string.
+	:param minimized: previous minimized string (a subsequence of original).
+	:returns: retained mask over original.
+	"""
+
+	retained = [False] * len(original)
+	cursor   = 0
+
+	for c in minimized:
+		cursor = original.find(c, cursor)
+
+		if cursor < 0: raise ValueError("minimized result is not a subsequence of the original")
+
+		retained[cursor] = True
+		cursor += 1
+
+	return retained
+
+
+def opcodes(original:str, target:str, level:int=0) -> list[tuple[str, int, int, int, int]]:
+	"""
+	Character-level edit opcodes of original -> target: diffed by coarse
+	units first, then refined inside changed hunks.
+
+	:param original: previous original string.
+	:param target: new input string.
+	:param level: index into SPLITTERS (past the end: characters).
+	:returns: difflib-style (tag, i1, i2, j1, j2) opcodes over characters.
+	"""
+
+	if level == len(SPLITTERS):
+		if len(original) * len(target) > REFINE_LIMIT: return [("replace", 0, len(original), 0, len(target))]
+
+		return SequenceMatcher(None, original, target, autojunk=False).get_opcodes()
+
+	a = SPLITTERS[level](original)
+	b = SPLITTERS[level](target)
+
+	# unit offsets
+	a_off = [0]
+	b_off = [0]
+
+	for unit in a: a_off.append(a_off[-1] + len(unit))
+	for unit in b: b_off.append(b_off[-1] + len(unit))
+
+	out = []
+
+	for tag, i1, i2, j1, j2 in SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+		ci1, ci2, cj1, cj2 = a_off[i1], a_off[i2], b_off[j1], b_off[j2]
+
+		if tag != "replace":
+			out.append((tag, ci1, ci2, cj1, cj2))
+			continue
+
+		for sub, si1, si2, sj1, sj2 in opcodes(original[ci1:ci2], target[cj1:cj2], level + 1):
+			out.append((sub, ci1 + si1, ci1 + si2, cj1 + sj1, cj1 + sj2))
+
+	return out
+
+
+def align_prior(
+	target:str,
+	prior:tuple[str, str]) -> tuple[str, list[tuple[int, int]], list[tuple[int, int]]]:
+
+	"""
+	Map a previous (original, minimized) result onto a changed input.
+
+	:param target: new input string.
+	:param prior: tuple of (previous original, previous minimized) strings.
+	:returns: tuple of (seed candidate, target regions that were previously
+		removed, target regions with no counterpart in the previous original).
+	"""
+
+	original, minimized = prior
+
+	# positions of previous original retained by the minimized result
+	retained = embed(original, minimized)
+
+	# align previous original against new input
+	removed = [False] * len(target)
+	fresh   = [False] * len(target)
+
+	for tag, i1, _, j1, j2 in opcodes(original, target):
+		if tag == "equal":
+			for j in range(j1, j2): removed[j] = not retained[i1 + j - j1]
+
+		# new material: keep (may be needed), but flag for fine-grained reduction
+		elif tag in ("replace", "insert"): fresh[j1:j2] = [True] * (j2 - j1)
+
+	seed = "".join(c for c, r in zip(target, removed) if not r)
+
+	return seed, runs(removed), runs(fresh)
+
+
+def region_sweep(
+	target:str,
+	regions:list[tuple[int, int]],
+	oracle:Callable) -> tuple[str, int, int]:
+
+	"""
+	Try removing each (previously removed) region in turn.
+
+	:param target: input string.
+	:param regions: sorted, disjoint [start, end) regions of target.
+	:param oracle: oracle function.
+	:returns: tuple of (reduced string, oracle calls, well-formed oracle calls).
+	"""
+
+	n_good_oracalls = 0
+
+	reduced = ""
+	cursor  = 0
+
+	for start, end in regions:
+		interesting, well_formed = oracle(reduced + target[cursor:start] + target[end:])
+
+		if well_formed: n_good_oracalls += 1
+
+		# drop region if not needed
+		reduced += target[cursor:start] if interesting else target[cursor:end]
+		cursor   = end
+
+	return reduced + target[cursor:], len(regions), n_good_oracalls
+
+
+def warm_start(
+	target:str,
+	prior:tuple[str, str],
+	oracle:Callable) -> tuple[str, int, int, int]:
+
+	"""
+	Seed minimization from a previous result on a (slightly) different input.
+
+	The mapped reduced configuration is proposed first; if accepted, only the
+	new material remains to be reduced, so partitioning starts at its
+	granularity. Otherwise the previously removed regions are swept as
+	partitions before a regular run.
+
+	:param target: new input string.
+	:param prior: tuple of (previous original, previous minimized) strings.
+	:param oracle: oracle function.
+	:returns: tuple of (reduced string, initial partition size, oracle calls,
+		well-formed oracle calls).
+	"""
+
+	seed, regions, fresh = align_prior(target, prior)
+
+	if not regions: return target, len(target) // 2, 0, 0
+
+	interesting, well_formed = oracle(seed)
+
+	n_total_oracalls = 1
+	n_good_oracalls  = int(well_formed)
+
+	if interesting:
+		# granularity of largest new run (power of 2), else a 1-minimality pass
+		longest = max((end - start for start, end in fresh), default=1)
+		partlen = min(1 << (longest - 1).bit_length(), max(len(seed) // 2, 1))
+
+		return seed, partlen, n_total_oracalls, n_good_oracalls
+
+	# fallback: previously removed regions as first partitions
+	reduced, n_sweep_total_oracalls, n_sweep_good_oracalls = region_sweep(target, regions, oracle)
+
+	n_total_oracalls += n_sweep_total_oracalls
+	n_good_oracalls  += n_sweep_good_oracalls
+
+	return reduced, len(reduced) // 2, n_total_oracalls, n_good_oracalls
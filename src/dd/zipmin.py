@@ -1,52 +1,55 @@
-from typing import Callable
+from typing import Callable, Optional
 from math import ceil
 from datetime import datetime
 
+from dd.warmstart import warm_start
+from dd.infer import VerdictIndex
+
 
 def remove_last_char(
-	pre:str, 
-	target:str, 
-	post:str, 
-	oracle:Callable) -> tuple[str, str, str]:
+	pre:str|list[int], 
+	target:str|list[int], 
+	post:str|list[int], 
+	oracle:Callable) -> tuple[str|list[int], str|list[int], str|list[int], bool]:
 	
 	"""
 	Zipping: add last char to postlude if needed.
 
 	:param pre: target prelude.
-	:param target: input string.
+	:param target: input string (or retained positions, see `VerdictIndex.bind`).
 	:param post: target postlude.
 	:param oracle: oracle function.
-	:returns: tuple of (prelude, target, postlude) strings.
+	:returns: tuple of (prelude, target, postlude, is well formed).
 	"""
 
 	interesting, well_formed = oracle(pre + target[:-1] + post)
 
 	if interesting: return pre, target[:-1], post, well_formed
-	else: return pre, target[:-1], target[-1] + post, well_formed
+	else: return pre, target[:-1], target[-1:] + post, well_formed
 
 
 def complement_sweep(
-	pre:str, 
-	target:str, 
-	post:str, 
+	pre:str|list[int], 
+	target:str|list[int], 
+	post:str|list[int], 
 	partlen:int, 
-	oracle:Callable) -> tuple[str, int]:
+	oracle:Callable) -> tuple[str|list[int], int]:
 	
 	"""
 	Identify benign chunks of target with variable granularity.
 
 	:param pre: target prelude.
-	:param target: input string.
+	:param target: input string (or retained positions, see `VerdictIndex.bind`).
 	:param post: target postlude.
 	:param partlen: partition length.
 	:param oracle: oracle function.
-	:returns: reduced string.
+	:returns: reduced target and no. of well-formed oracle calls.
 	"""
 	
 	# count no. of oracle calls that pass XML well-formedness pre-check
 	n_good_oracalls = 0
 
-	reduced = ""
+	reduced = target[:0]
 	
 	# test contiguous discrete chunks of size partlen for interestingness
 	for i in range(0, len(target), partlen):
@@ -67,7 +70,9 @@ def minimize(
 	target:str, 
 	oracle:Callable, 
 	stats:bool  =False, 
-	verbose:bool=False) -> tuple[str, int] | str:
+	verbose:bool=False,
+	prior:Optional[tuple[str, str]]=None,
+	index:Optional[VerdictIndex]   =None) -> tuple[str, int] | str:
 	
 	"""
 	ZipMin Delta-Debugging aglorithm.
@@ -76,6 +81,8 @@ def minimize(
 	:param oracle: oracle function.
 	:param stats: data collection flag.
 	:param verbose: verbose output flag.
+	:param prior: previous (original, minimized) pair to warm-start from.
+	:param index: verdict index to answer repeated/implied configurations from.
 	:returns: reduced string and optional stats.
 	"""
 
@@ -85,12 +92,28 @@ def minimize(
 	n_total_oracalls = 0
 	n_good_oracalls  = 0
 		
-	# pre and postludes
-	pre  = ""
-	post = ""
-
 	# partition size
 	partlen = len(target) // 2
+
+	# warm start: propose previous result mapped onto target, seed granularity
+	if prior is not None:
+		target, partlen, n_seed_total_oracalls, n_seed_good_oracalls = warm_start(target, prior, oracle)
+
+		if stats:
+			n_total_oracalls += n_seed_total_oracalls
+			n_good_oracalls  += n_seed_good_oracalls
+
+	# verdict inference: minimize retained positions, materialize candidates on demand
+	if index is not None:
+		source          = target
+		n_inferred      = index.n_inferred
+		n_inferred_good = index.n_inferred_good
+		target          = list(range(len(source)))
+		oracle          = index.bind(oracle, source)
+
+	# pre and postludes
+	pre  = target[:0]
+	post = target[:0]
 	
 	while partlen and target:
 		if verbose: print(f"[{datetime.now().strftime("%H:%M:%S")}]  {len(pre + target + post):.2E}  {partlen}")
@@ -128,5 +151,13 @@ def minimize(
 
 	# consolidate reduced target 
 	target = pre + target + post
+
+	if index is not None:
+		target = "".join(source[p] for p in target)
+
+		# count executed oracle calls only
+		if stats:
+			n_total_oracalls -= index.n_inferred - n_inferred
+			n_good_oracalls  -= index.n_inferred_good - n_inferred_good
 	
 	return (target, n_total_oracalls, n_good_oracalls) if stats else target
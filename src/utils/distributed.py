@@ -0,0 +1,405 @@
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree as ET
+import socketserver
+import threading
+import socket
+import queue
+import json
+import sys
+
+from utils.oracle import SAFE_PARSER
+from utils.store import PredicateTimeout
+
+
+# Protocol: newline-delimited JSON messages over TCP.
+#
+#   coordinator -> worker
+#     {"type": "hello"}
+#     {"type": "eval", "batch": [[id, candidate], ...]}
+#
+#   worker -> coordinator
+#     {"type": "hello", "case": <predicate name>}
+#     {"type": "heartbeat"}                                 (while evaluating)
+#     {"type": "result", "results": [[id, interesting, well_formed, timed_out], ...]}
+#     {"type": "error", "code": <exit code>}                (predicate broke)
+
+
+class WorkerUnavailable(RuntimeError):
+	def __init__(self, address:tuple[str, int], reason:str):
+		self.address = address
+
+		super().__init__(f"Oracle worker {address[0]}:{address[1]} unavailable: {reason}")
+
+
+def parse_address(spec:str) -> tuple[str, int]:
+	"""Parse a "host:port" (or bare "port" on localhost) worker address."""
+
+	host, _, port = spec.rpartition(":")
+
+	return host or "127.0.0.1", int(port)
+
+
+def send_message(wfile, message:dict) -> None:
+	wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+	wfile.flush()
+
+
+def recv_message(rfile) -> dict:
+	line = rfile.readline()
+
+	if not line: raise ConnectionError("connection closed")
+
+	return json.loads(line)
+
+
+# --- worker
+
+
+class WorkerHandler(socketserver.StreamRequestHandler):
+	"""Serve oracle evaluations for one coordinator connection."""
+
+	def send(self, message:dict) -> None:
+		with self.send_lock: send_message(self.wfile, message)
+
+
+	def heartbeat(self, busy:threading.Event) -> None:
+		"""Emit heartbeats while a batch is being evaluated."""
+
+		while not busy.wait(self.server.heartbeat):
+			try: self.send({"type": "heartbeat"})
+			except OSError: return
+
+
+	def handle(self) -> None:
+		self.send_lock = threading.Lock()
+
+		while True:
+			try: message = recv_message(self.rfile)
+			except (ConnectionError, OSError, ValueError): return
+
+			if message.get("type") == "hello":
+				self.send({"type": "hello", "case": self.server.case})
+				continue
+
+			if message.get("type") != "eval": continue
+
+			# heartbeat thread stops once the batch is done
+			done  = threading.Event()
+			pulse = threading.Thread(target=self.heartbeat, args=(done,), daemon=True)
+			pulse.start()
+
+			results = []
+
+			try:
+				for cid, candidate in message["batch"]:
+					# single predicate copy per worker: evaluate one candidate at a time
+					with self.server.oracle_lock:
+						try: results.append([cid, *self.server.oracle(candidate), False])
+						except PredicateTimeout: results.append([cid, False, True, True])
+
+			# predicate broke (e.g. BaseX server unreachable): report and drop connection
+			except SystemExit as e:
+				done.set()
+				self.send({"type": "error", "code": e.code})
+				return
+
+			finally: done.set()
+
+			self.send({"type": "result", "results": results})
+
+
+class WorkerServer(socketserver.ThreadingTCPServer):
+	"""
+	TCP oracle worker hosting one predicate (an oracle that may raise
+	`PredicateTimeout`, so timeouts are reported as such).
+	"""
+
+	daemon_threads      = True
+	block_on_close      = False
+	allow_reuse_address = True
+
+	def __init__(
+		self,
+		address:tuple[str, int],
+		oracle:Callable,
+		case:str,
+		heartbeat:float=1.0):
+
+		self.oracle      = oracle
+		self.oracle_lock = threading.Lock()
+		self.case        = case
+		self.heartbeat   = heartbeat
+
+		super().__init__(address, WorkerHandler)
+
+
+# --- coordinator
+
+
+class WorkerConnection():
+	"""Coordinator-side connection to one oracle worker."""
+
+	def __init__(self, address:tuple[str, int], timeout:float):
+		self.address = address
+
+		try:
+			self.sock  = socket.create_connection(address, timeout=timeout)
+			self.rfile = self.sock.makefile("rb")
+			self.wfile = self.sock.makefile("wb")
+
+			send_message(self.wfile, {"type": "hello"})
+
+			self.case = recv_message(self.rfile).get("case")
+
+		except (OSError, ValueError) as e: raise WorkerUnavailable(address, str(e))
+
+
+	def evaluate(self, batch:list[tuple[int, str]]) -> list[list]:
+		"""
+		Evaluate a batch remotely; any message (incl. heartbeats) resets the
+		socket timeout, so only a silent worker is considered dead.
+
+		:param batch: list of (id, candidate) pairs.
+		:returns: list of [id, interesting, well_formed, timed_out] results.
+		"""
+
+		try:
+			send_message(self.wfile, {"type": "eval", "batch": batch})
+
+			while True:
+				message = recv_message(self.rfile)
+
+				if message["type"] == "result": return message["results"]
+
+				if message["type"] == "error":
+					raise WorkerUnavailable(self.address, f"predicate exited with code {message.get('code')}")
+
+		except (OSError, ValueError, KeyError) as e: raise WorkerUnavailable(self.address, str(e))
+
+
+	def close(self) -> None:
+		try: self.sock.close()
+		except OSError: pass
+
+
+class Coordinator():
+	"""
+	Distribute candidate evaluations over remote oracle workers.
+
+	One long-lived thread per worker drains a shared queue of batches, so
+	concurrent evaluate() calls (and waves of candidates) keep every worker
+	busy. A single sequential caller (e.g. ddmin/zipmin querying one
+	candidate at a time) only ever occupies one worker.
+	"""
+
+	def __init__(
+		self,
+		addresses:list[tuple[str, int]],
+		case:Optional[str]=None,
+		batch_size:int    =8,
+		dead_after:float  =30.0):
+
+		"""
+		:param addresses: worker (host, port) addresses.
+		:param case: predicate name workers must host (None accepts any).
+		:param batch_size: max. candidates per request.
+		:param dead_after: seconds of worker silence before reassignment.
+		"""
+
+		self.batch_size = batch_size
+		self.workers    = []
+		self.pending    = queue.Queue()
+		self.finished   = threading.Condition()
+		self.closed     = False
+
+		for address in addresses:
+			try: conn = WorkerConnection(address, dead_after)
+			except WorkerUnavailable as e:
+				print(f"Warning: {e}", file=sys.stderr)
+				continue
+
+			if case is not None and conn.case != case:
+				conn.close()
+				continue
+
+			self.workers.append(conn)
+
+		if not self.workers: raise RuntimeError("No live oracle workers")
+
+		self.threads = [threading.Thread(target=self.drain, args=(conn,), daemon=True) for conn in self.workers]
+
+		for thread in self.threads: thread.start()
+
+
+	def __enter__(self):
+		return self
+
+
+	def __exit__(self, *exc):
+		self.close()
+
+
+	def drain(self, conn:WorkerConnection) -> None:
+		"""Worker thread: evaluate queued batches on one connection until closed or dead."""
+
+		while True:
+			item = self.pending.get()
+
+			if item is None: return
+
+			batch, job = item
+
+			try: batch_results = conn.evaluate(batch)
+
+			# reassign in-flight batch and retire worker
+			except WorkerUnavailable as e:
+				with self.finished:
+					if self.closed: return
+
+					print(f"Warning: {e}; reassigning {len(batch)} candidate(s)", file=sys.stderr)
+
+					self.pending.put(item)
+					conn.close()
+
+					self.workers.remove(conn)
+					self.finished.notify_all()
+
+				return
+
+			for i, interesting, well_formed, timed_out in batch_results:
+				job["results"][i] = (interesting, well_formed)
+
+				if timed_out: job["timeouts"].add(i)
+
+			with self.finished:
+				job["left"] -= 1
+				self.finished.notify_all()
+
+
+	def dispatch(self, candidates:list[str]) -> tuple[list[tuple[bool, bool]], set[int]]:
+		"""
+		Evaluate candidates in batches across live workers.
+
+		:param candidates: input strings.
+		:returns: tuple of ((is interesting, is well formed) tuples in order,
+			indices of candidates whose predicate run timed out).
+		"""
+
+		job     = {"results": [None] * len(candidates), "timeouts": set(), "left": 0}
+		batches = []
+
+		# (optimization) fail fast early: well-formedness pre-check before shipping
+		batch = []
+
+		for i, candidate in enumerate(candidates):
+			try: ET.fromstring(candidate, parser=SAFE_PARSER)
+			except Exception:
+				job["results"][i] = (False, False)
+				continue
+
+			batch.append((i, candidate))
+
+			if len(batch) == self.batch_size:
+				batches.append(batch)
+				batch = []
+
+		if batch: batches.append(batch)
+
+		with self.finished:
+			if not self.workers: raise RuntimeError("No live oracle workers")
+
+			job["left"] = len(batches)
+
+		for batch in batches: self.pending.put((batch, job))
+
+		with self.finished:
+			self.finished.wait_for(lambda: job["left"] == 0 or not self.workers)
+
+			if job["left"]: raise RuntimeError("No live oracle workers")
+
+		return job["results"], job["timeouts"]
+
+
+	def evaluate(self, candidates:list[str]) -> list[tuple[bool, bool]]:
+		"""
+		Evaluate candidates in batches across live workers (timeouts count
+		as uninteresting).
+
+		:param candidates: input strings.
+		:returns: list of (is interesting, is well formed) tuples, in order.
+		"""
+
+		return self.dispatch(candidates)[0]
+
+
+	def oracle(self, candidate:str) -> tuple[bool, bool]:
+		"""
+		Oracle function backed by the worker pool.
+
+		:param candidate: input string.
+		:returns: tuple of (is interesting, is well formed) booleans.
+		:raises PredicateTimeout: if the remote predicate timed out.
+		"""
+
+		results, timeouts = self.dispatch([candidate])
+
+		if timeouts: raise PredicateTimeout("remote predicate timed out")
+
+		return results[0]
+
+
+	def close(self) -> None:
+		with self.finished:
+			self.closed  = True
+			workers      = self.workers
+			self.workers = []
+
+			self.finished.notify_all()
+
+		# stop idle threads; busy ones fail on their closed connection
+		for _ in self.threads: self.pending.put(None)
+
+		for conn in workers: conn.close()
+
+
+class LocalPool():
+	"""Evaluate candidates in parallel over local oracles (one per predicate copy)."""
+
+	def __init__(self, oracles:list[Callable]):
+		self.oracles = queue.Queue()
+
+		for oracle in oracles: self.oracles.put(oracle)
+
+		self.executor = ThreadPoolExecutor(max_workers=len(oracles))
+
+
+	def __enter__(self):
+		return self
+
+
+	def __exit__(self, *exc):
+		self.close()
+
+
+	def call(self, candidate:str) -> tuple[bool, bool]:
+		# borrow an idle predicate copy
+		oracle = self.oracles.get()
+
+		try: return oracle(candidate)
+		finally: self.oracles.put(oracle)
+
+
+	def evaluate(self, candidates:list[str]) -> list[tuple[bool, bool]]:
+		"""
+		Evaluate candidates in parallel.
+
+		:param candidates: input strings.
+		:returns: list of (is interesting, is well formed) tuples, in order.
+		"""
+
+		return list(self.executor.map(self.call, candidates))
+
+
+	def close(self) -> None:
+		self.executor.shutdown()
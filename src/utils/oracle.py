@@ -1,7 +1,11 @@
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
 from lxml import etree as ET
 import subprocess
+import time
+
+from utils.store import VerdictStore, PredicateTimeout, predicate_key
 
 
 # shell script custom exit code to message map
@@ -9,6 +13,7 @@ EXIT_MESSAGES = {
 	2: "Invalid option or bad arguments",
 	3: "BaseX server not reachable",
 	4: "BaseX .jar file not found",
+	5: "AppCDS archive unusable (PREDICATE_JVM_CDS=require)",
 }
 
 
@@ -23,12 +28,31 @@ SAFE_PARSER = ET.XMLParser(
 )
 
 
+def reject_timeouts(oracle:Callable) -> Callable:
+	"""
+	Report predicate timeouts (`PredicateTimeout`) as uninteresting.
+
+	:param oracle: oracle function that may raise on timeout.
+	:returns: oracle function.
+	"""
+
+	def wrapped(candidate:str) -> tuple[bool, bool]:
+		try: return oracle(candidate)
+		except PredicateTimeout: return False, True
+
+	return wrapped
+
+
 def build_oracle(
 	base:Path, 
 	input_name:str, 
 	script_name:str, 
 	good_port:Optional[str]=None, 
-	timeout:Optional[float]=None) -> Callable:
+	timeout:Optional[float]=None,
+	store:Optional[VerdictStore]=None,
+	replay:bool=False,
+	replay_latency:float=1.0,
+	raise_timeouts:bool=False) -> Callable:
 	
 	"""
 	Generate XML oracle callable for debugger.
@@ -38,6 +62,10 @@ def build_oracle(
 	:param script_name: relative (to base) path to oracle shell script.
 	:param good_port: port on which "good" BaseX server is running.
 	:param timeout: subprocess timeout value.
+	:param store: verdict store to record (and replay) verdicts in.
+	:param replay: answer previously recorded candidates from store.
+	:param replay_latency: scale of simulated recorded latency on replay.
+	:param raise_timeouts: raise `PredicateTimeout` instead of reporting uninteresting.
 	:returns: oracle function.
 	"""
 
@@ -77,8 +105,8 @@ def build_oracle(
 				timeout=timeout,
 			)
 
-		# fail on timeout
-		except subprocess.TimeoutExpired: return False, True
+		# fail on timeout (uninteresting, but not recorded as a verdict)
+		except subprocess.TimeoutExpired: raise PredicateTimeout(f"predicate exceeded {timeout}s")
 
 		# handle breaking errors
 		if proc.returncode > 1: 
@@ -89,4 +117,207 @@ def build_oracle(
 		# "interesting" if desired error (retcode=0)
 		return proc.returncode == 0, True
 
+	# record/replay verdicts keyed by candidate digest
+	if store is not None: return store.wrap(oracle, predicate_key(base), replay, replay_latency)
+
+	return oracle if raise_timeouts else reject_timeouts(oracle)
+
+
+@dataclass
+class Stage:
+	"""
+	Discrete predicate stage: one command and its result extraction.
+
+	:param name: unique stage name (referenced by checks).
+	:param cmd: command to run (cwd is the predicate directory).
+	:param extract: maps combined stdout/stderr to a stage result.
+	:param diagnose: called with the stage output on non-zero exit; returns a fatal exit code or None.
+	"""
+
+	name:str
+	cmd:list[str]
+	extract:Callable[[str], Any]                   = lambda out: out
+	diagnose:Optional[Callable[[str], Optional[int]]] = None
+
+
+@dataclass
+class Check:
+	"""
+	Verdict condition over the results of one or more stages.
+
+	:param name: check name (for stats).
+	:param needs: names of stages whose results the check consumes.
+	:param holds: called with the needed results (in order); False rejects.
+	"""
+
+	name:str
+	needs:tuple[str, ...]
+	holds:Callable[..., bool]
+
+
+@dataclass
+class StageProfile:
+	"""Observed per-stage cost and per-check rejection counters."""
+
+	runs:dict[str, int]      = field(default_factory=dict)
+	seconds:dict[str, float] = field(default_factory=dict)
+	evals:dict[str, int]     = field(default_factory=dict)
+	rejects:dict[str, int]   = field(default_factory=dict)
+
+
+	def cost(self, stage:str) -> float:
+		"""Mean observed stage runtime (1s prior for unseen stages)."""
+
+		n = self.runs.get(stage, 0)
+
+		return self.seconds[stage] / n if n else 1.0
+
+
+	def reject_rate(self, check:str) -> float:
+		"""Laplace-smoothed observed rejection rate of a check."""
+
+		return (self.rejects.get(check, 0) + 1) / (self.evals.get(check, 0) + 2)
+
+
+def build_staged_oracle(
+	base:Path, 
+	input_name:str, 
+	stages:list[Stage], 
+	checks:list[Check], 
+	timeout:Optional[float]=None,
+	store:Optional[VerdictStore]=None,
+	replay:bool=False,
+	replay_latency:float=1.0,
+	raise_timeouts:bool=False) -> Callable:
+	
+	"""
+	Generate XML oracle callable that evaluates a predicate as discrete stages.
+
+	Stages are only run when a pending check needs them. The next check is 
+	picked greedily by (cost of its missing stages) / (rejection rate), both 
+	observed across calls, so each candidate is decided by the cheapest 
+	sufficient subset of stages. A candidate is interesting iff all checks hold.
+
+	:param base: path to predicate directory.
+	:param input_name: relative (to base) path to input.
+	:param stages: predicate stages.
+	:param checks: verdict conditions over stage results.
+	:param timeout: per-candidate timeout value (shared by all its stages).
+	:param store: verdict store to record (and replay) verdicts in.
+	:param replay: answer previously recorded candidates from store.
+	:param replay_latency: scale of simulated recorded latency on replay.
+	:param raise_timeouts: raise `PredicateTimeout` instead of reporting uninteresting.
+	:returns: oracle function (stage profile exposed as `oracle.profile`).
+	"""
+
+	xml_path = base / input_name
+	by_name  = {stage.name: stage for stage in stages}
+	profile  = StageProfile()
+
+	for check in checks:
+		for name in check.needs: 
+			if name not in by_name: raise ValueError(f"Check '{check.name}' needs unknown stage '{name}'")
+
+	def run_stage(stage:Stage, budget:Optional[float]) -> tuple[bool, Any]:
+		"""Run a stage within the candidate's remaining budget; returns (succeeded, extracted result)."""
+
+		if budget is not None and budget <= 0: raise subprocess.TimeoutExpired(stage.cmd, 0)
+
+		start = time.perf_counter()
+
+		try:
+			proc = subprocess.run(stage.cmd,
+				cwd    =base,
+				stdout =subprocess.PIPE,
+				stderr =subprocess.STDOUT,
+				text   =True,
+				errors ="replace",
+				timeout=budget,
+			)
+
+		finally:
+			profile.runs[stage.name]    = profile.runs.get(stage.name, 0) + 1
+			profile.seconds[stage.name] = profile.seconds.get(stage.name, 0.0) + time.perf_counter() - start
+
+		if proc.returncode != 0:
+			# handle breaking errors
+			code = stage.diagnose(proc.stdout) if stage.diagnose else None
+
+			if code is not None:
+				print(f"Fatal Error ({code}): {EXIT_MESSAGES.get(code, 'Unknown')}")
+
+				raise SystemExit(code)
+
+			return False, None
+
+		return True, stage.extract(proc.stdout)
+
+	def oracle(candidate:str) -> tuple[bool, bool]:
+		"""
+		Perform pre-check(s) and evaluate predicate stages on candidate string.
+
+		:param candidate: input string.
+		:returns: tuple of (is interesting, is well formed) booleans.
+		"""
+
+		# (optimization) fail fast early: well-formedness pre-check
+		try: ET.fromstring(candidate, parser=SAFE_PARSER)
+		except Exception: return False, False
+
+		# write candidate to file and atomically replace
+		tmp_path = xml_path.with_suffix(xml_path.suffix + ".tmp")
+		tmp_path.write_text(candidate, encoding="utf-8")
+		tmp_path.replace(xml_path)
+
+		results = {}
+		pending = list(checks)
+
+		# one deadline per candidate, shared by its stages
+		deadline = time.monotonic() + timeout if timeout is not None else None
+
+		while pending:
+			# cheapest expected cost per rejection first (ties keep declaration order)
+			check = min(pending, key=lambda c: sum(
+				profile.cost(name) for name in set(c.needs) if name not in results
+			) / profile.reject_rate(c.name))
+
+			pending.remove(check)
+
+			profile.evals[check.name] = profile.evals.get(check.name, 0) + 1
+
+			holds     = True
+			timed_out = False
+
+			for name in check.needs:
+				if name in results: continue
+
+				budget = deadline - time.monotonic() if deadline is not None else None
+
+				try: ok, results[name] = run_stage(by_name[name], budget)
+				
+				# fail on timeout (uninteresting, but not recorded as a verdict)
+				except subprocess.TimeoutExpired: ok, timed_out = False, True
+				
+				if not ok:
+					holds = False
+					break
+
+			if holds: holds = bool(check.holds(*(results[name] for name in check.needs)))
+
+			# early exit: verdict determined by first failing check
+			if not holds:
+				profile.rejects[check.name] = profile.rejects.get(check.name, 0) + 1
+
+				if timed_out: raise PredicateTimeout(f"predicate exceeded {timeout}s (at stage '{name}')")
+				
+				return False, True
+
+		return True, True
+
+	# record/replay verdicts keyed by candidate digest
+	if store is not None: oracle = store.wrap(oracle, predicate_key(base), replay, replay_latency)
+	elif not raise_timeouts: oracle = reject_timeouts(oracle)
+
+	oracle.profile = profile
+
 	return oracle
@@ -1,7 +1,13 @@
 from pathlib import Path
+import contextlib
 import tempfile
+import hashlib
 import shutil
+import fcntl
+import json
+import stat
 import sys
+import os
 
 
 class RamDiskUnavailable(RuntimeError):
@@ -11,15 +17,189 @@ class RamDiskUnavailable(RuntimeError):
 		super().__init__(f"RAM-disk unavailable at {self.ram_root}")
 
 
+def sha256_file(path:Path) -> str:
+	with path.open("rb") as f:
+		h = hashlib.sha256()
+
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			h.update(chunk)
+
+	return h.hexdigest()
+
+
+class StagingArea():
+	"""
+	Content-addressed store of immutable assets on a RAM-disk.
+
+	Each distinct file is copied once to objects/<sha256> (read-only) and
+	hard-linked into per-run directories, so the object's link count doubles
+	as its reference count. Objects keep the source's mtime (tools such as
+	AppCDS validate jar mtimes); a file whose content is stored under a
+	different mtime gets a private copy instead. Staging and collection hold an exclusive
+	lock on the area, making them safe under concurrent runs.
+	"""
+
+	def __init__(self, root:Path=Path("/dev/shm"), name:str="dd-zipmin-stage"):
+		if not root.exists() or not root.is_dir(): raise RamDiskUnavailable(root)
+
+		self.path    = root / name
+		self.objects = self.path / "objects"
+		self.objects.mkdir(parents=True, exist_ok=True)
+
+		# (optimization) source digests keyed by (path, size, mtime), shared across runs
+		try: self.digests = json.loads((self.path / "digests.json").read_text(encoding="utf-8"))
+		except (OSError, ValueError): self.digests = {}
+
+		self.dirty = False
+
+
+	@contextlib.contextmanager
+	def locked(self):
+		"""Hold the area-wide exclusive lock."""
+
+		with open(self.path / ".lock", "a") as f:
+			fcntl.flock(f, fcntl.LOCK_EX)
+
+			try: yield
+			finally: fcntl.flock(f, fcntl.LOCK_UN)
+
+
+	def digest(self, source:Path) -> str:
+		"""
+		SHA-256 of a file, re-hashed only if its size or mtime changed.
+
+		:param source: file to hash.
+		:returns: hex digest.
+		"""
+
+		st  = source.stat()
+		key = f"{source.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+
+		if key not in self.digests:
+			self.digests[key] = sha256_file(source)
+			self.dirty        = True
+
+		return self.digests[key]
+
+
+	def save_digests(self) -> None:
+		"""Persist the digest cache (atomic replace; concurrent writers may drop entries)."""
+
+		if not self.dirty: return
+
+		tmp = self.path / f".digests.{os.getpid()}.tmp"
+
+		tmp.write_text(json.dumps(self.digests), encoding="utf-8")
+		os.replace(tmp, self.path / "digests.json")
+
+		self.dirty = False
+
+
+	def put(self, source:Path, digest:str) -> Path:
+		"""
+		Add a file to the store (no-op if its content is already present).
+		Caller must hold the lock.
+
+		:param source: file to add.
+		:param digest: SHA-256 of source.
+		:returns: path of the stored object.
+		"""
+
+		obj = self.objects / digest
+
+		if not obj.exists():
+			tmp = obj.with_name(f".{obj.name}.{os.getpid()}.tmp")
+
+			# keep mtime: staged jars must match their AppCDS archives
+			shutil.copy2(source, tmp)
+			os.chmod(tmp, stat.S_IMODE(source.stat().st_mode) & ~0o222)
+			os.replace(tmp, obj)
+
+		return obj
+
+
+	def link(self, source:Path, dest:Path) -> list[Path]:
+		"""
+		Stage a file tree: hard-link stored objects into dest.
+
+		:param source: file tree to stage.
+		:param dest: destination (must not exist).
+		:returns: stored objects referenced by dest.
+		"""
+
+		used    = []
+		entries = []
+
+		# hash outside the lock (cached digests make this a stat per file)
+		for dirpath, dirnames, filenames in os.walk(source):
+			rel = Path(dirpath).relative_to(source)
+
+			for name in dirnames + filenames:
+				src = Path(dirpath) / name
+
+				if src.is_symlink(): entries.append((rel, name, src, None))
+				elif name in filenames: entries.append((rel, name, src, self.digest(src)))
+
+			if not dirnames and not filenames: entries.append((rel, None, None, None))
+
+		self.save_digests()
+
+		with self.locked():
+			for rel, name, src, digest in entries:
+				(dest / rel).mkdir(parents=True, exist_ok=True)
+
+				if name is None: continue
+
+				dst = dest / rel / name
+
+				# preserve symlinks as-is
+				if digest is None:
+					os.symlink(os.readlink(src), dst)
+					continue
+
+				obj = self.put(src, digest)
+
+				# same content stored from a file with another mtime: private copy keeps ours
+				if obj.stat().st_mtime_ns != src.stat().st_mtime_ns:
+					shutil.copy2(src, dst)
+					continue
+
+				# fall back to a private copy if hard links are unsupported
+				try: os.link(obj, dst)
+				except OSError:
+					shutil.copy2(src, dst)
+					continue
+
+				used.append(obj)
+
+		return used
+
+
+	def release(self, objects:list[Path]) -> None:
+		"""
+		Drop stored objects that no run links to any more.
+
+		:param objects: candidate objects (e.g. those of a cleaned run).
+		"""
+
+		with self.locked():
+			for obj in set(objects):
+				try:
+					if obj.stat().st_nlink <= 1: obj.unlink()
+				except FileNotFoundError: pass
+
+
 class RamDir():
 	"""RAM-disk temp. directory manager."""
 
 	def __init__(self, prefix:str, root:Path=Path("/dev/shm")):
 		if not root.exists() or not root.is_dir(): raise RamDiskUnavailable(root)
-		
+
 		self.prefix   = prefix
 		self.root = root
 		self.path  = Path(tempfile.mkdtemp(prefix=f"{self.prefix}-", dir=self.root))
+		self.staged = []
+		self.area   = None
 
 
 	def __str__(self):
@@ -29,7 +209,7 @@ class RamDir():
 	def copy(self, dir_map:list[tuple[Path, str]]) -> None:
 		"""
 		Copy file trees to RAM-disk directory.
-		
+
 		:param dir_map: map of source -> destination paths.
 		"""
 
@@ -38,8 +218,47 @@ class RamDir():
 			shutil.copytree(source, self.path / dest)
 
 
+	def stage(self, dir_map:list[tuple[Path, str]]) -> None:
+		"""
+		Link immutable file trees into RAM-disk directory from the shared,
+		content-addressed staging area (copied to RAM-disk at most once).
+
+		:param dir_map: map of source -> destination paths.
+		"""
+
+		if self.area is None: self.area = StagingArea(self.root)
+
+		for (source, dest) in dir_map:
+			self.staged += self.area.link(source, self.path / dest)
+
+
+	def predicate_copy(self, base_path:Path) -> Path:
+		"""
+		Set up a runnable copy of a predicate case directory: the case itself
+		is copied, its sibling `lib` and `shared` assets are staged.
+
+		:param base_path: predicate case directory.
+		:returns: path to the case directory copy.
+		"""
+
+		self.copy([(base_path, base_path.name)])
+
+		# immutable assets: shared, content-addressed staging (copied once, hard-linked)
+		self.stage([
+			(base_path.parent / "lib", "lib"),
+			(base_path.parent / "shared", "shared")
+		])
+
+		return self.path / base_path.name
+
+
 	def clean(self) -> None:
-		"""Remove directory from RAM-disk."""
+		"""Remove directory from RAM-disk (and release its staged assets)."""
 
 		try: shutil.rmtree(self.path)
 		except Exception as e: print(f"Warning: failed to clean ramdisk dir: {e}", file=sys.stderr)
+
+		if self.area is None: return
+
+		try: self.area.release(self.staged)
+		except Exception as e: print(f"Warning: failed to release staged assets: {e}", file=sys.stderr)
@@ -0,0 +1,144 @@
+from pathlib import Path
+from typing import Callable, Optional
+import threading
+import hashlib
+import sqlite3
+import time
+
+
+class PredicateTimeout(RuntimeError):
+	"""Live predicate run timed out: no verdict (treated as uninteresting, never recorded)."""
+
+
+def predicate_key(base:Path) -> str:
+	"""
+	Identify a predicate independently of where it runs from (in-place or
+	RAM-disk copy): case name plus digest of its query and BaseX versions.
+
+	:param base: path to predicate directory.
+	:returns: predicate key.
+	"""
+
+	h = hashlib.sha256()
+
+	for name in ("query.xq", "v.sh"):
+		path = base / name
+
+		if path.is_file(): h.update(path.read_bytes())
+
+	return f"{base.name}:{h.hexdigest()[:16]}"
+
+
+class VerdictStore():
+	"""
+	On-disk (SQLite) store of oracle verdicts, shared across runs and
+	algorithms: (predicate, candidate sha256) -> (interesting, well formed,
+	latency).
+	"""
+
+	def __init__(self, path:Path):
+		self.path = path
+		self.lock = threading.Lock()
+
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+
+		self.db = sqlite3.connect(self.path, timeout=60.0, check_same_thread=False)
+
+		self.db.execute("PRAGMA journal_mode=WAL")
+		self.db.execute("""
+			CREATE TABLE IF NOT EXISTS verdicts (
+				predicate   TEXT    NOT NULL,
+				digest      BLOB    NOT NULL,
+				interesting INTEGER NOT NULL,
+				well_formed INTEGER NOT NULL,
+				latency     REAL    NOT NULL,
+				PRIMARY KEY (predicate, digest)
+			) WITHOUT ROWID
+		""")
+		self.db.commit()
+
+
+	def get(self, predicate:str, digest:bytes) -> Optional[tuple[bool, bool, float]]:
+		"""
+		Look up a recorded verdict.
+
+		:returns: tuple of (is interesting, is well formed, latency) or None.
+		"""
+
+		with self.lock:
+			row = self.db.execute(
+				"SELECT interesting, well_formed, latency FROM verdicts WHERE predicate = ? AND digest = ?",
+				(predicate, digest)
+			).fetchone()
+
+		return None if row is None else (bool(row[0]), bool(row[1]), row[2])
+
+
+	def put(self, predicate:str, digest:bytes, interesting:bool, well_formed:bool, latency:float) -> None:
+		"""Record a verdict (latest recording wins)."""
+
+		with self.lock:
+			self.db.execute(
+				"INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?)",
+				(predicate, digest, int(interesting), int(well_formed), latency)
+			)
+			self.db.commit()
+
+
+	def wrap(
+		self,
+		oracle:Callable,
+		predicate:str,
+		replay:bool         =False,
+		replay_latency:float=1.0) -> Callable:
+
+		"""
+		Record every oracle verdict; with replay, answer previously seen
+		candidates from the store and only fall through to the live oracle
+		for unseen ones. Timeouts (`PredicateTimeout` raised by the live
+		oracle) count as uninteresting but are not recorded.
+
+		:param oracle: live oracle function.
+		:param predicate: predicate key (see `predicate_key`).
+		:param replay: answer from the store when possible.
+		:param replay_latency: scale of the simulated (slept) recorded latency.
+		:returns: oracle function (hit counters and recorded latency of replayed
+			verdicts, i.e. simulated predicate time, exposed as `oracle.store_stats`).
+		"""
+
+		stats = {"replayed": 0, "live": 0, "replayed_seconds": 0.0}
+
+		def recorded(candidate:str) -> tuple[bool, bool]:
+			digest = hashlib.sha256(candidate.encode("utf-8")).digest()
+
+			if replay and (hit := self.get(predicate, digest)) is not None:
+				interesting, well_formed, latency = hit
+
+				# simulate recorded predicate latency
+				if replay_latency > 0: time.sleep(latency * replay_latency)
+
+				stats["replayed"]         += 1
+				stats["replayed_seconds"] += latency
+
+				return interesting, well_formed
+
+			start = time.perf_counter()
+
+			stats["live"] += 1
+
+			# timeout: not a verdict of the predicate, may not recur
+			try: interesting, well_formed = oracle(candidate)
+			except PredicateTimeout: return False, True
+
+			# malformed candidates are rejected by the pre-check: not worth storing
+			if well_formed: self.put(predicate, digest, interesting, well_formed, time.perf_counter() - start)
+
+			return interesting, well_formed
+
+		recorded.store_stats = stats
+
+		return recorded
+
+
+	def close(self) -> None:
+		with self.lock: self.db.close()
@@ -0,0 +1,152 @@
+from pathlib import Path
+import socket
+import os
+import re
+
+from utils.oracle import Stage, Check
+
+
+HOST = "127.0.0.1"
+USER = "admin"
+PASS = "password"
+
+RE_VERSION = re.compile(r'^\s*(GOOD_VERSION|BAD_VERSION)\s*=\s*"?([^"\s]*)"?\s*$', re.MULTILINE)
+RE_ID      = re.compile(r'id="([^"\n]*)"')
+
+SAXON_ARCHIVE = "saxon-12.4"
+
+# startup-oriented JVM flags (short-lived predicate launches), see shared/r_base.sh
+STARTUP_FLAGS = ["-XX:TieredStopAtLevel=1", "-XX:+UseSerialGC", "-XX:-UsePerfData"]
+
+
+def saxon_classpath(lib_dir:Path) -> str:
+	return f"{lib_dir / 'saxon-he-12.4.jar'}:{lib_dir / 'xmlresolver-5.2.0' / 'lib' / '*'}"
+
+
+def basex_classpath(lib_dir:Path, version:str) -> str:
+	return str(lib_dir / f"basex-{version}.jar")
+
+
+def jvm_options(lib_dir:Path, archive:str) -> list[str]:
+	"""
+	JVM launch options for a predicate stage: the jar set's AppCDS archive
+	(lib/cds/<archive>.jsa, see scripts/jvm_cds) unless PREDICATE_JVM_CDS=0
+	(=require: fail if the archive is unusable instead of silently running
+	without it), and startup flags if PREDICATE_JVM_STARTUP=1.
+
+	:param lib_dir: path to predicate lib directory.
+	:param archive: archive name (jar set).
+	:returns: list of JVM options.
+	"""
+
+	opts = []
+	path = lib_dir / "cds" / f"{archive}.jsa"
+
+	mode = os.environ.get("PREDICATE_JVM_CDS", "1")
+
+	if mode == "require": opts += [f"-XX:SharedArchiveFile={path}", "-Xshare:on"]
+	elif mode != "0" and path.is_file(): opts += [f"-XX:SharedArchiveFile={path}", "-Xshare:auto"]
+	
+	if os.environ.get("PREDICATE_JVM_STARTUP", "0") == "1": opts += STARTUP_FLAGS
+
+	return opts
+
+
+def cds_failed(output:str) -> bool:
+	"""Whether a launch failed on a required but unusable AppCDS archive (see jvm_options)."""
+
+	return os.environ.get("PREDICATE_JVM_CDS", "1") == "require" and "shared archive" in output.lower()
+
+
+def read_versions(case_dir:Path) -> tuple[str, str]:
+	"""
+	Read BaseX versions from a predicate's v.sh.
+
+	:param case_dir: path to predicate directory.
+	:returns: tuple of (good, bad) version tags.
+	"""
+
+	versions = dict(RE_VERSION.findall((case_dir / "v.sh").read_text(encoding="utf-8")))
+
+	try: return versions["GOOD_VERSION"], versions["BAD_VERSION"]
+	except KeyError: raise ValueError(f"Could not parse GOOD_VERSION/BAD_VERSION from {case_dir / 'v.sh'}")
+
+
+def extract_ids(output:str) -> list[str]:
+	"""Extract non-blank id="..." attribute values (grep/sed pipeline of r_base.sh)."""
+
+	return [i for i in RE_ID.findall(output) if i.strip()]
+
+
+def port_listening(port:int, host:str=HOST) -> bool:
+	"""Check whether a server is accepting connections on host:port."""
+
+	try:
+		with socket.create_connection((host, port), timeout=1.0): return True
+	except OSError: return False
+
+
+def xmlprocessor_stages(
+	base:Path,
+	input_name:str,
+	good_port:str|int) -> tuple[list[Stage], list[Check]]:
+
+	"""
+	Describe the xmlprocessor predicate (shared/r_base.sh) as discrete stages.
+
+	Interesting iff Saxon and BaseX-bad results differ and Saxon and
+	BaseX-good results agree (on extracted ids).
+
+	:param base: path to predicate directory.
+	:param input_name: relative (to base) path to input.
+	:param good_port: port on which "good" BaseX server is running.
+	:returns: tuple of (stages, checks) for `build_staged_oracle`.
+	"""
+
+	lib_dir    = (base.parent / "lib").resolve()
+	input_path = str(base / input_name)
+	query_path = str(base / "query.xq")
+
+	good_version, bad_version = read_versions(base)
+
+	def basex_stage(name:str, version:str, port:int) -> Stage:
+		jar = lib_dir / f"basex-{version}.jar"
+
+		def diagnose(output:str) -> int|None:
+			if cds_failed(output): return 5
+			if not port_listening(port): return 3
+			if not jar.is_file(): return 4
+
+			return None
+
+		return Stage(
+			name    =name,
+			cmd     =[
+				"java", *jvm_options(lib_dir, f"basex-{version}"), "-cp", basex_classpath(lib_dir, version), "org.basex.BaseXClient",
+				"-n", HOST, "-p", str(port), "-U", USER, "-P", PASS,
+				"-i", input_path, query_path
+			],
+			extract =extract_ids,
+			diagnose=diagnose,
+		)
+
+	stages = [
+		Stage(
+			name    ="saxon",
+			cmd     =[
+				"java", *jvm_options(lib_dir, SAXON_ARCHIVE), "-cp", saxon_classpath(lib_dir),
+				"net.sf.saxon.Query", f"-s:{input_path}", f"-q:{query_path}"
+			],
+			extract =extract_ids,
+			diagnose=lambda output: 5 if cds_failed(output) else None,
+		),
+		basex_stage("basex_bad", bad_version, int(good_port) + 1),
+		basex_stage("basex_good", good_version, int(good_port)),
+	]
+
+	checks = [
+		Check("bad_differs", ("saxon", "basex_bad"), lambda saxon, bad: saxon != bad),
+		Check("good_agrees", ("saxon", "basex_good"), lambda saxon, good: saxon == good),
+	]
+
+	return stages, checks
@@ -0,0 +1,20 @@
+from dd.ddmin import minimize as ddmin
+from dd.zipmin import minimize as zipmin
+
+
+VARIANTS = {
+	"ddmin": ddmin,
+	"zipmin": zipmin
+}
+
+
+def counting(predicate):
+	"""Wrap a boolean predicate as a (interesting, well formed) oracle with a call counter."""
+
+	calls = []
+
+	def oracle(s:str) -> tuple[bool, bool]:
+		calls.append(s)
+		return predicate(s), True
+
+	return oracle, calls
@@ -0,0 +1,122 @@
+import unittest
+import threading
+import time
+
+from utils.distributed import Coordinator, WorkerServer
+from utils.store import PredicateTimeout
+
+
+def contains_b(candidate:str) -> tuple[bool, bool]:
+	return "b" in candidate, True
+
+
+class TestDistributed(unittest.TestCase):
+	"""Coordinator/worker evaluation over localhost TCP."""
+
+	def setUp(self):
+		self.servers = []
+
+	def tearDown(self):
+		for server in self.servers:
+			server.shutdown()
+			server.server_close()
+
+	def _worker(self, oracle, case="case", heartbeat=0.05):
+		server = WorkerServer(("127.0.0.1", 0), oracle, case, heartbeat)
+
+		threading.Thread(target=server.serve_forever, daemon=True).start()
+
+		self.servers.append(server)
+
+		return server.server_address
+
+	# ---
+
+	def test_batched_results_keep_order(self):
+		addresses  = [self._worker(contains_b), self._worker(contains_b)]
+		candidates = [f"<r>{c}</r>" for c in "abcabcab"] + ["<r>"]
+
+		with Coordinator(addresses, batch_size=3) as coordinator:
+			self.assertEqual(
+				coordinator.evaluate(candidates),
+				[("b" in c, True) for c in candidates[:-1]] + [(False, False)]
+			)
+
+
+	def test_filters_workers_by_case(self):
+		addresses = [self._worker(contains_b, case="other"), self._worker(contains_b)]
+
+		with Coordinator(addresses, case="case") as coordinator:
+			self.assertEqual(len(coordinator.workers), 1)
+			self.assertEqual(coordinator.oracle("<b/>"), (True, True))
+
+
+	def test_reassigns_from_broken_worker(self):
+		def broken(candidate):
+			raise SystemExit(3)
+
+		addresses = [self._worker(broken), self._worker(contains_b)]
+
+		with Coordinator(addresses, batch_size=1) as coordinator:
+			self.assertEqual(coordinator.evaluate(["<b/>"] * 4), [(True, True)] * 4)
+			self.assertEqual(len(coordinator.workers), 1)
+
+
+	def test_reassigns_from_silent_worker(self):
+		def hung(candidate):
+			time.sleep(2)
+			return contains_b(candidate)
+
+		addresses = [self._worker(hung, heartbeat=60), self._worker(contains_b)]
+
+		with Coordinator(addresses, batch_size=1, dead_after=0.3) as coordinator:
+			self.assertEqual(coordinator.evaluate(["<b/>", "<a/>"]), [(True, True), (False, True)])
+
+
+	def test_heartbeats_keep_slow_worker_alive(self):
+		def slow(candidate):
+			time.sleep(0.4)
+			return contains_b(candidate)
+
+		addresses = [self._worker(slow, heartbeat=0.05)]
+
+		with Coordinator(addresses, dead_after=0.2) as coordinator:
+			self.assertEqual(coordinator.oracle("<b/>"), (True, True))
+
+
+	def test_sequential_calls_reuse_worker_threads(self):
+		addresses = [self._worker(contains_b), self._worker(contains_b)]
+
+		with Coordinator(addresses) as coordinator:
+			threads = list(coordinator.threads)
+			start   = time.perf_counter()
+
+			for _ in range(100): self.assertEqual(coordinator.oracle("<b/>"), (True, True))
+
+			self.assertLess(time.perf_counter() - start, 2.0)
+			self.assertEqual(coordinator.threads, threads)
+			self.assertTrue(all(thread.is_alive() for thread in threads))
+
+
+	def test_remote_timeouts_reported(self):
+		def timing_out(candidate):
+			if "slow" in candidate: raise PredicateTimeout("timed out")
+			return contains_b(candidate)
+
+		with Coordinator([self._worker(timing_out)]) as coordinator:
+			self.assertEqual(coordinator.evaluate(["<slow/>", "<b/>"]), [(False, True), (True, True)])
+			self.assertEqual(coordinator.oracle("<b/>"), (True, True))
+
+			with self.assertRaises(PredicateTimeout): coordinator.oracle("<slow/>")
+
+
+	def test_no_live_workers(self):
+		def broken(candidate):
+			raise SystemExit(3)
+
+		with Coordinator([self._worker(broken)]) as coordinator:
+			with self.assertRaises(RuntimeError): coordinator.oracle("<b/>")
+
+
+if __name__ == "__main__":
+	unittest.main()
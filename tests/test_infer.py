@@ -0,0 +1,89 @@
+import unittest
+
+from dd.ddmin import minimize as ddmin
+from dd.infer import VerdictIndex, bitmask, spans
+from helpers import VARIANTS, counting
+
+
+class TestVerdictInference(unittest.TestCase):
+	"""Monotonicity-based verdict inference over retained span sets."""
+
+	def _tt_same_result_fewer_calls(self, target, predicate, monotone):
+		"""Test template: inference keeps the result and never adds oracle calls."""
+
+		for name, callback in VARIANTS.items():
+			with self.subTest(variant=name):
+				oracle, plain_calls = counting(predicate)
+				expected, n_plain, _ = callback(target, oracle, stats=True)
+
+				index                   = VerdictIndex(monotone=monotone)
+				oracle, calls           = counting(predicate)
+				result, n_total, n_good = callback(target, oracle, stats=True, index=index)
+
+				self.assertEqual(result, expected)
+				self.assertEqual(index.n_executed, len(calls))
+				self.assertEqual(n_total, n_plain - index.n_inferred)
+
+				# executed calls are all well formed here
+				self.assertEqual(n_good, len(calls))
+				self.assertLessEqual(len(calls), len(plain_calls))
+
+	# ---
+
+	def test_spans_and_subset_masks(self):
+		self.assertEqual(spans([0, 1, 2, 5, 7, 8]), [(0, 3), (5, 6), (7, 9)])
+
+		small, large = bitmask(spans([1, 5])), bitmask(spans([0, 1, 2, 5]))
+
+		self.assertEqual(small & ~large, 0)
+		self.assertNotEqual(large & ~small, 0)
+
+
+	def test_index_infers_implied_verdicts(self):
+		index = VerdictIndex(monotone=True)
+
+		index.add(bitmask([(0, 4)]), 4, False, True)
+		index.add(bitmask([(2, 3)]), 1, True, True)
+
+		self.assertEqual(index.infer(bitmask([(0, 1), (2, 3)]), 2), (False, True))
+		self.assertEqual(index.infer(bitmask([(0, 2)]), 2), (False, True))
+		self.assertEqual(index.infer(bitmask([(2, 6)]), 4), (True, True))
+		self.assertIsNone(index.infer(bitmask([(5, 6)]), 1))
+
+
+	def test_malformed_verdicts_not_generalized(self):
+		index = VerdictIndex(monotone=True)
+
+		index.add(bitmask([(0, 4)]), 4, False, False)
+
+		self.assertIsNone(index.infer(bitmask([(0, 2)]), 2))
+
+		# exact repeat reports the recorded pre-check result
+		self.assertEqual(index.infer(bitmask([(0, 4)]), 4), (False, False))
+
+
+	def test_monotone_saves_calls(self):
+		self._tt_same_result_fewer_calls(
+			target="zzazbzczzqqqqqqqqqqqqqqqqqqqq",
+			predicate=lambda s: "a" in s and "c" in s,
+			monotone=True
+		)
+
+		# at least one variant re-probes implied configurations on this input
+		index     = VerdictIndex(monotone=True)
+		oracle, _ = counting(lambda s: "a" in s and "c" in s)
+		ddmin("zzazbzczzqqqqqqqqqqqqqqqqqqqq", oracle, index=index)
+
+		self.assertGreater(index.n_inferred, 0)
+
+
+	def test_exact_repeats_only(self):
+		self._tt_same_result_fewer_calls(
+			target=("x" * 300) + "needle" + ("x" * 400),
+			predicate=lambda s: "needle" in s,
+			monotone=False
+		)
+
+
+if __name__ == "__main__":
+	unittest.main()
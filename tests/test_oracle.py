@@ -0,0 +1,81 @@
+import unittest
+import tempfile
+import sys
+from pathlib import Path
+
+from utils.oracle import Stage, Check, build_staged_oracle
+from utils.store import PredicateTimeout
+from utils.xmlprocessor import extract_ids
+
+
+def echo_stage(name:str, text:str, delay:float=0.0) -> Stage:
+	"""Stage printing fixed text (stands in for a Saxon/BaseX run)."""
+
+	return Stage(name, [sys.executable, "-c", f"import time; time.sleep({delay}); print({text!r})"], extract_ids)
+
+
+class TestStagedOracle(unittest.TestCase):
+	"""Staged predicate evaluation: verdicts, early exit, cost ordering."""
+
+	def setUp(self):
+		self.tmp  = tempfile.TemporaryDirectory()
+		self.base = Path(self.tmp.name)
+
+	def tearDown(self):
+		self.tmp.cleanup()
+
+	def _oracle(self, saxon, bad, good, bad_delay=0.0):
+		stages = [echo_stage("saxon", saxon), echo_stage("bad", bad, bad_delay), echo_stage("good", good)]
+		checks = [
+			Check("bad_differs", ("saxon", "bad"), lambda s, b: s != b),
+			Check("good_agrees", ("saxon", "good"), lambda s, g: s == g),
+		]
+
+		return build_staged_oracle(self.base, "input.xml", stages, checks)
+
+	# ---
+
+	def test_interesting_when_all_checks_hold(self):
+		oracle = self._oracle('<a id="1"/><a id="2"/>', '<a id="1"/>', '<a id="1"/><a id="2"/>')
+
+		self.assertEqual(oracle("<r/>"), (True, True))
+
+
+	def test_malformed_candidate_skips_stages(self):
+		oracle = self._oracle('<a id="1"/>', '<a id="2"/>', '<a id="1"/>')
+
+		self.assertEqual(oracle("<r>"), (False, False))
+		self.assertEqual(oracle.profile.runs, {})
+
+
+	def test_early_exit_skips_remaining_stages(self):
+		oracle = self._oracle('<a id="1"/>', '<a id="1"/>', '<a id="1"/>')
+
+		self.assertEqual(oracle("<r/>"), (False, True))
+		self.assertNotIn("good", oracle.profile.runs)
+
+
+	def test_reorders_by_observed_rejection_rate(self):
+		oracle = self._oracle('<a id="1"/>', '<a id="2"/>', '<a id="3"/>', bad_delay=0.2)
+
+		for _ in range(4): self.assertEqual(oracle("<r/>"), (False, True))
+
+		# good_agrees always rejects (and is cheaper): bad stage is no longer needed after the first call
+		self.assertEqual(oracle.profile.runs["bad"], 1)
+		self.assertEqual(oracle.profile.runs["good"], 4)
+
+
+	def test_timeout_is_shared_by_stages(self):
+		# each stage fits the timeout on its own, all three together do not
+		stages = [echo_stage(name, '<a id="1"/>', 0.5) for name in ("saxon", "bad", "good")]
+		checks = [
+			Check("bad_differs", ("saxon", "bad"), lambda s, b: s == b),
+			Check("good_agrees", ("saxon", "good"), lambda s, g: s == g),
+		]
+		oracle = build_staged_oracle(self.base, "input.xml", stages, checks, timeout=1.2, raise_timeouts=True)
+
+		with self.assertRaises(PredicateTimeout): oracle("<r/>")
+
+
+if __name__ == "__main__":
+	unittest.main()
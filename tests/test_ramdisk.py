@@ -0,0 +1,128 @@
+import unittest
+import tempfile
+import os
+from pathlib import Path
+from unittest import mock
+
+from utils import ramdisk
+from utils.ramdisk import RamDir
+
+
+class TestStaging(unittest.TestCase):
+	"""Content-addressed, reference-counted RAM-disk staging."""
+
+	def setUp(self):
+		self.tmp  = tempfile.TemporaryDirectory()
+		self.root = Path(self.tmp.name) / "shm"
+		self.src  = Path(self.tmp.name) / "lib"
+
+		self.root.mkdir()
+		(self.src / "sub").mkdir(parents=True)
+		(self.src / "a.jar").write_bytes(b"jar-a")
+		(self.src / "sub" / "b.jar").write_bytes(b"jar-b")
+		(self.src / "dup.jar").write_bytes(b"jar-a")
+		os.utime(self.src / "dup.jar", ns=(0, (self.src / "a.jar").stat().st_mtime_ns))
+		os.symlink("a.jar", self.src / "link.jar")
+
+	def tearDown(self):
+		self.tmp.cleanup()
+
+	def _objects(self):
+		return sorted(p.name for p in (self.root / "dd-zipmin-stage" / "objects").iterdir())
+
+	# ---
+
+	def test_runs_share_staged_files(self):
+		first, second = RamDir("a", self.root), RamDir("b", self.root)
+
+		first.stage([(self.src, "lib")])
+		second.stage([(self.src, "lib")])
+
+		self.assertEqual((second.path / "lib" / "sub" / "b.jar").read_bytes(), b"jar-b")
+		self.assertTrue((second.path / "lib" / "link.jar").is_symlink())
+		self.assertTrue(os.path.samefile(first.path / "lib" / "a.jar", second.path / "lib" / "dup.jar"))
+
+		# identical content stored once
+		self.assertEqual(len(self._objects()), 2)
+
+		first.clean()
+		second.clean()
+
+
+	def test_predicate_copy_layout(self):
+		case = Path(self.tmp.name) / "case"
+		case.mkdir()
+		(case / "input.xml").write_text("<r/>")
+		(Path(self.tmp.name) / "shared").mkdir()
+		(Path(self.tmp.name) / "shared" / "r_base.sh").write_text("#!/bin/sh")
+
+		run = RamDir("p", self.root)
+		run_base = run.predicate_copy(case)
+
+		self.assertEqual(run_base, run.path / "case")
+		self.assertEqual((run_base / "input.xml").read_text(), "<r/>")
+		self.assertEqual((run_base.parent / "lib" / "a.jar").read_bytes(), b"jar-a")
+		self.assertTrue((run_base.parent / "shared" / "r_base.sh").exists())
+
+		run.clean()
+		self.assertEqual(self._objects(), [])
+
+
+	def test_objects_released_with_last_run(self):
+		first, second = RamDir("a", self.root), RamDir("b", self.root)
+
+		first.stage([(self.src, "lib")])
+		second.stage([(self.src, "lib")])
+
+		first.clean()
+		self.assertFalse(first.path.exists())
+		self.assertEqual(len(self._objects()), 2)
+
+		second.clean()
+		self.assertEqual(self._objects(), [])
+
+
+	def test_staged_files_are_read_only(self):
+		run = RamDir("a", self.root)
+		run.stage([(self.src, "lib")])
+
+		self.assertFalse(os.stat(run.path / "lib" / "a.jar").st_mode & 0o222)
+
+		run.clean()
+
+
+	def test_staged_files_keep_mtime(self):
+		os.utime(self.src / "a.jar", ns=(1_000_000_000, 1_000_000_000))
+
+		run = RamDir("a", self.root)
+		run.stage([(self.src, "lib")])
+
+		self.assertEqual(os.stat(run.path / "lib" / "a.jar").st_mtime_ns, 1_000_000_000)
+		self.assertEqual(os.stat(run.path / "lib" / "dup.jar").st_mtime_ns, (self.src / "dup.jar").stat().st_mtime_ns)
+
+		run.clean()
+
+
+	def test_unchanged_sources_not_rehashed(self):
+		first, second = RamDir("a", self.root), RamDir("b", self.root)
+
+		first.stage([(self.src, "lib")])
+
+		with mock.patch.object(ramdisk, "sha256_file", wraps=ramdisk.sha256_file) as sha:
+			second.stage([(self.src, "lib")])
+			self.assertEqual(sha.call_count, 0)
+
+			# changed source is re-hashed
+			(self.src / "a.jar").write_bytes(b"jar-a2")
+
+			third = RamDir("c", self.root)
+			third.stage([(self.src, "lib")])
+
+			self.assertEqual(sha.call_count, 1)
+			self.assertEqual((third.path / "lib" / "a.jar").read_bytes(), b"jar-a2")
+
+		for run in (first, second, third): run.clean()
+
+
+if __name__ == "__main__":
+	unittest.main()
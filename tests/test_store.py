@@ -0,0 +1,107 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+from utils.oracle import build_oracle
+from utils.store import VerdictStore, predicate_key
+
+
+class TestVerdictStore(unittest.TestCase):
+	"""Record/replay of oracle verdicts."""
+
+	def setUp(self):
+		self.tmp  = tempfile.TemporaryDirectory()
+		self.base = Path(self.tmp.name) / "xml-case"
+		self.db   = Path(self.tmp.name) / "verdicts.db"
+
+		# stand-in predicate: interesting iff input contains "b"
+		self.base.mkdir()
+		(self.base / "r.sh").write_text('echo run >> calls.log; grep -q slow input.xml && sleep 5; grep -q b input.xml\n')
+		(self.base / "query.xq").write_text("//*")
+
+	def tearDown(self):
+		self.tmp.cleanup()
+
+	def _oracle(self, store, replay=False):
+		return build_oracle(self.base, "input.xml", "r.sh", timeout=1.0, store=store, replay=replay, replay_latency=0)
+
+	def _live_calls(self):
+		log = self.base / "calls.log"
+
+		return len(log.read_text().splitlines()) if log.exists() else 0
+
+	# ---
+
+	def test_replay_answers_recorded_candidates(self):
+		store  = VerdictStore(self.db)
+		oracle = self._oracle(store)
+
+		self.assertEqual(oracle("<b/>"), (True, True))
+		self.assertEqual(oracle("<a/>"), (False, True))
+		store.close()
+
+		# fresh store instance: verdicts persisted on disk
+		store  = VerdictStore(self.db)
+		oracle = self._oracle(store, replay=True)
+
+		self.assertEqual(oracle("<b/>"), (True, True))
+		self.assertEqual(oracle("<a/>"), (False, True))
+		self.assertEqual(self._live_calls(), 2)
+		self.assertEqual((oracle.store_stats["replayed"], oracle.store_stats["live"]), (2, 0))
+
+		# recorded latency accounted as simulated time (replay_latency=0: not slept)
+		self.assertGreater(oracle.store_stats["replayed_seconds"], 0.0)
+
+		# unseen candidate falls through to the live predicate
+		self.assertEqual(oracle("<c><b/></c>"), (True, True))
+		self.assertEqual(self._live_calls(), 3)
+		store.close()
+
+
+	def test_record_only_always_runs_predicate(self):
+		store  = VerdictStore(self.db)
+		oracle = self._oracle(store)
+
+		oracle("<b/>")
+		oracle("<b/>")
+
+		self.assertEqual(self._live_calls(), 2)
+		store.close()
+
+
+	def test_malformed_candidates_not_stored(self):
+		store  = VerdictStore(self.db)
+		oracle = self._oracle(store)
+
+		self.assertEqual(oracle("<b>"), (False, False))
+		self.assertEqual(store.db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0], 0)
+		store.close()
+
+
+	def test_timeouts_not_stored(self):
+		store  = VerdictStore(self.db)
+		oracle = self._oracle(store, replay=True)
+
+		self.assertEqual(oracle("<slow/>"), (False, True))
+		self.assertEqual(store.db.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0], 0)
+
+		# retried live on the next call
+		self.assertEqual(oracle("<slow/>"), (False, True))
+		self.assertEqual(oracle.store_stats, {"replayed": 0, "live": 2, "replayed_seconds": 0.0})
+		store.close()
+
+
+	def test_predicate_key_ignores_location(self):
+		copy = Path(self.tmp.name) / "ram" / "xml-case"
+		copy.mkdir(parents=True)
+		(copy / "query.xq").write_text("//*")
+
+		self.assertEqual(predicate_key(self.base), predicate_key(copy))
+
+		(copy / "query.xq").write_text("//a")
+
+		self.assertNotEqual(predicate_key(self.base), predicate_key(copy))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from dd.verify import units, verify_minimal
+from utils.distributed import LocalPool
+
+
+def pool_of(predicate, jobs=4):
+	"""Local pool of (interesting, well formed) oracles over a boolean predicate."""
+
+	return LocalPool([lambda s: (predicate(s), True)] * jobs)
+
+
+class TestVerifyMinimal(unittest.TestCase):
+	"""1-minimality verification via single-unit removal probes."""
+
+	def test_minimal_result(self):
+		with pool_of(lambda s: "a" in s and "c" in s and s.find("a") < s.find("c")) as pool:
+			report = verify_minimal("ac", pool.evaluate)
+
+		self.assertTrue(report["minimal"])
+		self.assertEqual(report["probes"], 2)
+		self.assertEqual(report["missed_bytes"], 0)
+
+
+	def test_target_must_reproduce(self):
+		with pool_of(lambda s: False) as pool:
+			report = verify_minimal("<a>xyz</a>", pool.evaluate)
+
+		self.assertFalse(report["reproduces"])
+		self.assertIsNone(report["minimal"])
+		self.assertEqual(report["probes"], 0)
+
+
+	def test_stops_at_first_counterexample_wave(self):
+		with pool_of(lambda s: "b" in s) as pool:
+			report = verify_minimal("xbxxxxxxxxxxxxxx", pool.evaluate, wave=4)
+
+		self.assertFalse(report["minimal"])
+		self.assertFalse(report["complete"])
+		self.assertEqual(report["probes"], 4)
+		self.assertEqual([c["start"] for c in report["counterexamples"]], [0, 2, 3])
+
+
+	def test_collects_all_counterexamples(self):
+		with pool_of(lambda s: "b" in s) as pool:
+			report = verify_minimal("xbxx", pool.evaluate, find_all=True, wave=1)
+
+		self.assertTrue(report["complete"])
+		self.assertEqual(len(report["counterexamples"]), 3)
+
+
+	def test_token_units(self):
+		target = '<a id="1">hi there</a>&amp;'
+
+		self.assertEqual(
+			[target[s:e] for s, e in units(target, "token")],
+			['<a id="1">', "hi", " ", "there", "</a>", "&amp;"]
+		)
+
+		with pool_of(lambda s: "<a" in s and "</a>" in s) as pool:
+			report = verify_minimal(target, pool.evaluate, granularity="token", find_all=True)
+
+		self.assertEqual(report["missed_bytes"], len("there"))
+
+
+if __name__ == "__main__":
+	unittest.main()
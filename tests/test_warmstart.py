@@ -0,0 +1,107 @@
+import unittest
+import random
+import time
+
+from dd.warmstart import align_prior, embed
+from helpers import VARIANTS, counting
+
+
+class TestWarmStart(unittest.TestCase):
+	"""Warm-start re-minimization from a previous result."""
+
+	def _tt_warm_vs_cold(self, original, target, predicate, expected):
+		"""Test template: warm start reaches the same result with fewer oracle calls."""
+
+		for name, callback in VARIANTS.items():
+			with self.subTest(variant=name):
+				oracle, _ = counting(predicate)
+				minimized = callback(original, oracle)
+
+				oracle, cold_calls = counting(predicate)
+				self.assertEqual(callback(target, oracle), expected)
+
+				oracle, warm_calls = counting(predicate)
+				self.assertEqual(callback(target, oracle, prior=(original, minimized)), expected)
+
+				self.assertLess(len(warm_calls), len(cold_calls))
+
+	# ---
+
+	def test_align_maps_removed_and_new_regions(self):
+		seed, removed, fresh = align_prior("xxabxxYYcd", ("xxabxxcd", "bc"))
+
+		self.assertEqual(seed, "bYYc")
+		self.assertEqual(removed, [(0, 3), (4, 6), (9, 10)])
+		self.assertEqual(fresh, [(6, 8)])
+
+
+	def test_align_unchanged_input_reproduces_prior(self):
+		rng    = random.Random(0)
+		target = "".join(rng.choice("<a/> \n=\"xyz") for _ in range(5000))
+
+		for fragment in (3, 6):
+			for _ in range(10):
+				with self.subTest(fragment=fragment):
+					starts    = sorted(rng.sample(range(0, len(target) - fragment, fragment), 15))
+					minimized = "".join(target[i:i + fragment] for i in starts)
+
+					self.assertEqual(align_prior(target, (target, minimized))[0], minimized)
+
+
+	def test_align_large_input(self):
+		lines    = [f'<item id="{i}">value {i * 7 % 13}</item>\n' for i in range(4000)]
+		original = "".join(lines)
+		target   = "".join(lines[:2000] + ['<new attr="1"/>\n'] + lines[2000:3000] + lines[3001:])
+
+		# single-line XML: coarse diff falls back to tags
+		flat = (original.replace("\n", ""), target.replace("\n", ""))
+
+		for original, target in ((original, target), flat):
+			start = time.perf_counter()
+			seed, _, fresh = align_prior(target, (original, lines[2500].strip()))
+
+			self.assertLess(time.perf_counter() - start, 2.0)
+
+			# previous result plus the new material
+			self.assertEqual(seed.strip(), lines[2500].strip() + '<new attr="1"/>')
+			self.assertEqual([target[s:e].strip() for s, e in fresh], ['<new attr="1"/>'])
+
+
+	def test_embed_rejects_non_subsequence(self):
+		with self.assertRaises(ValueError): embed("abc", "ca")
+
+
+	def test_same_input(self):
+		self._tt_warm_vs_cold(
+			original=("x" * 300) + "needle" + ("x" * 400),
+			target  =("x" * 300) + "needle" + ("x" * 400),
+			predicate=lambda s: "needle" in s,
+			expected="needle"
+		)
+
+
+	def test_changed_input(self):
+		self._tt_warm_vs_cold(
+			original=("a" * 200) + "<b>" + ("a" * 200) + "</b>" + ("a" * 100),
+			target  =("a" * 150) + "zz" + ("a" * 50) + "<b>" + ("a" * 200) + "</b>" + ("a" * 120),
+			predicate=lambda s: "<b>" in s and "</b>" in s,
+			expected="<b></b>"
+		)
+
+
+	def test_rejected_seed_falls_back(self):
+		# previously removed "B" is now required: seed is rejected
+		original = ("x" * 100) + "A" + ("x" * 100) + "B" + ("x" * 100)
+
+		for name, callback in VARIANTS.items():
+			with self.subTest(variant=name):
+				oracle, _ = counting(lambda s: "A" in s)
+				minimized = callback(original, oracle)
+
+				oracle, calls = counting(lambda s: "A" in s and "B" in s)
+				self.assertEqual(callback(original, oracle, prior=(original, minimized)), "AB")
+				self.assertEqual(calls[0], "A")
+
+
+if __name__ == "__main__":
+	unittest.main()
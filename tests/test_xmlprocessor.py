@@ -0,0 +1,112 @@
+import importlib.machinery
+import importlib.util
+import unittest
+import tempfile
+import os
+from pathlib import Path
+from unittest import mock
+
+from utils.xmlprocessor import STARTUP_FLAGS, cds_failed, jvm_options, read_versions, xmlprocessor_stages
+
+
+def load_script(name:str):
+	"""Import an extension-less script from scripts/ as a module."""
+
+	path   = Path(__file__).resolve().parents[1] / "scripts" / name
+	loader = importlib.machinery.SourceFileLoader(name, str(path))
+	module = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+
+	loader.exec_module(module)
+
+	return module
+
+
+class TestXmlProcessor(unittest.TestCase):
+	"""Predicate helpers: v.sh parsing, JVM launch options, archive keys."""
+
+	def setUp(self):
+		self.tmp  = tempfile.TemporaryDirectory()
+		self.root = Path(self.tmp.name)
+		self.lib  = self.root / "lib"
+		self.case = self.root / "xml-case"
+
+		(self.lib / "cds").mkdir(parents=True)
+		self.case.mkdir()
+		(self.case / "v.sh").write_text('#!/bin/bash\nGOOD_VERSION="b818d9f"\n  BAD_VERSION=7165a07\n')
+
+	def tearDown(self):
+		self.tmp.cleanup()
+
+	# ---
+
+	def test_read_versions(self):
+		self.assertEqual(read_versions(self.case), ("b818d9f", "7165a07"))
+
+		(self.case / "v.sh").write_text('GOOD_VERSION="b818d9f"\n')
+
+		with self.assertRaises(ValueError): read_versions(self.case)
+
+
+	def test_jvm_options_by_environment(self):
+		archive = self.lib / "cds" / "saxon-12.4.jsa"
+		shared  = [f"-XX:SharedArchiveFile={archive}", "-Xshare:auto"]
+
+		cases = [
+			({}, []),
+			({"PREDICATE_JVM_STARTUP": "1"}, STARTUP_FLAGS),
+			({"PREDICATE_JVM_CDS": "require"}, [f"-XX:SharedArchiveFile={archive}", "-Xshare:on"]),
+		]
+
+		for env, expected in cases:
+			with self.subTest(env=env, archive=False), mock.patch.dict(os.environ, env, clear=True):
+				self.assertEqual(jvm_options(self.lib, "saxon-12.4"), expected)
+
+		archive.write_bytes(b"jsa")
+
+		cases = [
+			({}, shared),
+			({"PREDICATE_JVM_CDS": "0"}, []),
+			({"PREDICATE_JVM_STARTUP": "1"}, shared + STARTUP_FLAGS),
+		]
+
+		for env, expected in cases:
+			with self.subTest(env=env, archive=True), mock.patch.dict(os.environ, env, clear=True):
+				self.assertEqual(jvm_options(self.lib, "saxon-12.4"), expected)
+
+
+	def test_required_archive_failure_is_fatal(self):
+		output = "Error occurred during initialization of VM\nAn error has occurred while processing the shared archive file."
+
+		with mock.patch.dict(os.environ, {"PREDICATE_JVM_CDS": "require"}):
+			self.assertTrue(cds_failed(output))
+
+			stages, _ = xmlprocessor_stages(self.case, "input.xml", "1984")
+
+			self.assertEqual({stage.name: stage.diagnose(output) for stage in stages}, {"saxon": 5, "basex_bad": 5, "basex_good": 5})
+
+		with mock.patch.dict(os.environ, {"PREDICATE_JVM_CDS": "1"}):
+			self.assertFalse(cds_failed(output))
+
+
+	def test_archive_key_covers_classpath_jars(self):
+		jvm_cds = load_script("jvm_cds")
+
+		(self.lib / "resolver").mkdir()
+		(self.lib / "resolver" / "b.jar").write_bytes(b"b")
+		(self.lib / "a.jar").write_bytes(b"a")
+
+		classpath = f"{self.lib / 'a.jar'}:{self.lib / 'resolver' / '*'}"
+
+		self.assertEqual(jvm_cds.classpath_jars(classpath), [self.lib / "a.jar", self.lib / "resolver" / "b.jar"])
+
+		key = jvm_cds.archive_key(classpath, "jdk-21")
+
+		self.assertNotEqual(key, jvm_cds.archive_key(classpath, "jdk-17"))
+
+		(self.lib / "resolver" / "b.jar").write_bytes(b"b2")
+
+		self.assertNotEqual(key, jvm_cds.archive_key(classpath, "jdk-21"))
+
+
+if __name__ == "__main__":
+	unittest.main()